@@ -1,9 +1,404 @@
+import hashlib
+import json
+import mmap
+import os
+import random
+import string
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left, bisect_right, insort
+
 def linearSearch(db, target):
     for item in db:
         if item["name"].lower() == target.lower():
             return item
     return None
 
+#Normalizes an item name the same way linearSearch compares them (case-insensitive)
+def foldName(name):
+    return name.lower()
+
+#Scans one slice of the catalog and returns the first item for each wanted folded name
+def scanForNames(db, wanted, start=0, stop=None):
+    found = {}
+    for position in range(start, len(db) if stop is None else stop):
+        item = db[position]
+        key = foldName(item["name"])
+        if key in wanted and key not in found:
+            found[key] = item
+            if len(found) == len(wanted):  # every target resolved, no need to read the rest
+                break
+    return found
+
+#Looks up many names at once, returning linearSearch's answer for each target in input order.
+#db can be the marketplace list (resolved in one pass over it) or any catalog with findByName (resolved through its index);
+#workers splits the list pass across a thread pool, which only runs in parallel on free-threaded Python builds
+def batchSearch(db, targets, workers=None):
+    wanted = {foldName(target) for target in targets}
+    if hasattr(db, "findByName"):
+        found = {key: db.findByName(key) for key in wanted}
+    elif workers and workers > 1 and len(db) > workers:
+        chunkSize = -(-len(db) // workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            chunks = pool.map(lambda start: scanForNames(db, wanted, start, min(start + chunkSize, len(db))),
+                              range(0, len(db), chunkSize))
+            found = {}
+            for chunkFound in chunks:  # chunks come back in list order, so the earliest match for each name wins
+                for key, item in chunkFound.items():
+                    found.setdefault(key, item)
+    else:
+        found = scanForNames(db, wanted)
+    return [found.get(foldName(target)) for target in targets]
+
+# — Indexed Catalog
+#The Class MarketplaceIndex
+# - built once from the marketplace list of dicts, keeps hash indexes on the case-folded name and on the id so lookups are O(1)
+class MarketplaceIndex:
+    def __init__(self, db=()): # builds the name and id indexes from a list of item dicts, keeping the list order for duplicate names.
+        self.nameIndex = {}
+        self.idIndex = {}
+        self.positions = {}  # id -> catalog position (insertion order), which keeps each name bucket in linearSearch order
+        self.nextPosition = 0
+        self.sortedNames = []  # distinct folded names in sorted order, for prefix lookups
+        self.sortedPrices = []  # (price, id) pairs in sorted order, for price range queries
+        self.fuzzyIndex = PartitionIndex()
+        self.addMany(db)
+    def __len__(self):
+        return len(self.idIndex)
+    def add(self, item): # indexes a new item; ids must be unique.
+        if item["id"] in self.idIndex:
+            raise ValueError(f"Item id {item['id']} is already in the index.")
+        self.idIndex[item["id"]] = item
+        self.positions[item["id"]] = self.nextPosition
+        self.nextPosition += 1
+        self.indexName(item)
+        insort(self.sortedPrices, (item["price"], item["id"]))
+    def addMany(self, items): # bulk insert: indexes every item, then sorts the prefix index once instead of inserting names one by one.
+        items = list(items)
+        seenIds = set()
+        for item in items: # checks every id before touching any index, so a duplicate leaves the index unchanged
+            if item["id"] in self.idIndex or item["id"] in seenIds:
+                raise ValueError(f"Item id {item['id']} is already in the index.")
+            seenIds.add(item["id"])
+        newNames = []
+        for item in items:
+            self.idIndex[item["id"]] = item
+            self.positions[item["id"]] = self.nextPosition
+            self.nextPosition += 1
+            key = foldName(item["name"])
+            sameName = self.nameIndex.get(key)
+            if sameName is None:
+                self.nameIndex[key] = [item]
+                newNames.append(key)
+                self.fuzzyIndex.add(key)
+            else:
+                sameName.append(item)
+            self.sortedPrices.append((item["price"], item["id"]))
+        if newNames:
+            self.sortedNames.extend(newNames)
+            self.sortedNames.sort()
+        self.sortedPrices.sort()
+    def remove(self, itemId): # removes the item with the given id from every index and returns it.
+        item = self.idIndex.pop(itemId)
+        self.unindexName(item)
+        del self.positions[itemId]
+        del self.sortedPrices[bisect_left(self.sortedPrices, (item["price"], itemId))]
+        return item
+    def rename(self, itemId, newName): # renames an item in place and moves it to its new name bucket, at its catalog position.
+        item = self.idIndex[itemId]
+        if foldName(item["name"]) == foldName(newName):
+            item["name"] = newName
+            return item
+        self.unindexName(item)
+        item["name"] = newName
+        self.indexName(item)
+        return item
+    def reprice(self, itemId, newPrice): # changes an item's price in place and moves it within the price index.
+        item = self.idIndex[itemId]
+        del self.sortedPrices[bisect_left(self.sortedPrices, (item["price"], itemId))]
+        item["price"] = newPrice
+        insort(self.sortedPrices, (newPrice, itemId))
+        return item
+    def indexName(self, item): # adds the item under its folded name, registering new names with the prefix and fuzzy indexes.
+        key = foldName(item["name"])
+        sameName = self.nameIndex.get(key)
+        if sameName is None:
+            self.nameIndex[key] = [item]
+            insort(self.sortedNames, key)
+            self.fuzzyIndex.add(key)
+        else:
+            insort(sameName, item, key=lambda other: self.positions[other["id"]])
+    def unindexName(self, item): # drops the item from its name bucket, and the name from the prefix index once the bucket is empty.
+        key = foldName(item["name"])
+        sameName = self.nameIndex[key]
+        sameName.remove(item)
+        if not sameName:
+            del self.nameIndex[key]
+            del self.sortedNames[bisect_left(self.sortedNames, key)]
+            self.fuzzyIndex.remove(key)
+    def findByName(self, target): # same result as linearSearch(db, target): the first item with that name, or None.
+        sameName = self.nameIndex.get(foldName(target))
+        return sameName[0] if sameName else None
+    def findById(self, itemId):
+        return self.idIndex.get(itemId)
+    def autocomplete(self, prefix, k=10): # returns up to k items whose name starts with prefix, in alphabetical name order (exact match first).
+        key = foldName(prefix)
+        results = []
+        position = bisect_left(self.sortedNames, key)
+        while position < len(self.sortedNames) and len(results) < k:
+            name = self.sortedNames[position]
+            if not name.startswith(key):
+                break
+            results.extend(self.nameIndex[name][:k - len(results)])
+            position += 1
+        return results
+    def find(self, namePrefix=None, minPrice=None, maxPrice=None, limit=None): # items matching every given filter, cheapest first.
+        low = 0 if minPrice is None else bisect_left(self.sortedPrices, (minPrice,))
+        high = len(self.sortedPrices) if maxPrice is None else bisect_right(self.sortedPrices, (maxPrice, float("inf")))
+        key = None if namePrefix is None else foldName(namePrefix)
+        if key is not None:
+            firstName = bisect_left(self.sortedNames, key)
+            lastName = bisect_left(self.sortedNames, key + "\U0010ffff")
+            if lastName - firstName < high - low:  # fewer names share the prefix than prices fall in range, so drive from the name index
+                matches = [item for name in self.sortedNames[firstName:lastName] for item in self.nameIndex[name]
+                           if (minPrice is None or item["price"] >= minPrice) and (maxPrice is None or item["price"] <= maxPrice)]
+                return sorted(matches, key=lambda item: (item["price"], item["id"]))[:limit]
+        results = []
+        for position in range(low, high):
+            if limit is not None and len(results) >= limit:
+                break
+            item = self.idIndex[self.sortedPrices[position][1]]
+            if key is None or foldName(item["name"]).startswith(key):
+                results.append(item)
+        return results
+    def fuzzySearch(self, query, maxDistance=None, k=10): # returns up to k (item, distance) pairs within maxDistance edits, closest first.
+        key = foldName(query)
+        if maxDistance is None:
+            maxDistance = 0 if len(key) <= 2 else 1 if len(key) <= 5 else 2  # short queries tolerate fewer typos
+        matches = self.fuzzyIndex.search(key, maxDistance)
+        results = []
+        for distance, name in sorted(matches):
+            for item in self.nameIndex.get(name, ()):
+                if len(results) == k:
+                    return results
+                results.append((item, distance))
+        return results
+
+# — Fuzzy Name Search
+#Levenshtein edit distance between two strings, giving up early once every path exceeds limit
+def editDistance(a, b, limit=None):
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previousRow = list(range(len(b) + 1))
+    for i, charA in enumerate(a, 1):
+        currentRow = [i]
+        for j, charB in enumerate(b, 1):
+            currentRow.append(min(previousRow[j] + 1, currentRow[j - 1] + 1, previousRow[j - 1] + (charA != charB)))
+        if limit is not None and min(currentRow) > limit:
+            return limit + 1
+        previousRow = currentRow
+    return previousRow[-1]
+
+#Bit masks of the positions where each character occurs in pattern, for bitEditDistance
+def patternMasks(pattern):
+    masks = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+#Levenshtein distance between a pattern (its patternMasks and length) and text, using Myers' bit-parallel algorithm
+#in Hyyrö's form for whole strings: each character of text advances a full column of the table in a few integer operations
+def bitEditDistance(masks, patternLength, text):
+    if patternLength == 0:
+        return len(text)
+    full = (1 << patternLength) - 1
+    top = 1 << (patternLength - 1)
+    positive, negative, score = full, 0, patternLength
+    for char in text:
+        match = masks.get(char, 0)
+        vertical = match | negative
+        horizontal = (((match & positive) + positive) ^ positive) | match
+        horizontalPositive = negative | ~(horizontal | positive)
+        horizontalNegative = positive & horizontal
+        if horizontalPositive & top:
+            score += 1
+        elif horizontalNegative & top:
+            score -= 1
+        horizontalPositive = (horizontalPositive << 1) | 1
+        horizontalNegative <<= 1
+        positive = (horizontalNegative | ~(vertical | horizontalPositive)) & full
+        negative = horizontalPositive & vertical & full
+    return score
+
+#Piece boundaries for cutting a name of the given length into parts pieces of near-equal length
+def partitionBounds(length, parts):
+    return [length * i // parts for i in range(parts + 1)]
+
+#Cuts a name into parts pieces; returns (start position, piece) pairs
+def partitionName(name, parts):
+    bounds = partitionBounds(len(name), parts)
+    return [(bounds[i], name[bounds[i]:bounds[i + 1]]) for i in range(parts)]
+
+#The Class PartitionIndex
+# - pigeonhole filter: d edits touch at most d of a name's d + 1 pieces, so one piece survives unchanged in the query,
+#   moved by a shift s with |s| + |Δ - s| <= d (edits before the piece move it, edits after it make up the rest of
+#   the length difference Δ); one such piece i also has at most i edits before it and d - i after it
+# - keeps one partition per distance 1..maxDistance, keyed by (d, name length, piece number, piece), so a query looks up
+#   only names within d of its length, at the few positions each piece can occupy, then verifies them with bitEditDistance
+class PartitionIndex:
+    def __init__(self, maxDistance=2):
+        self.maxDistance = maxDistance
+        self.postings = {}
+        self.names = set()
+    def __len__(self):
+        return len(self.names)
+    def keys(self, name): # every posting key of a name, one per piece per indexed distance.
+        for distance in range(1, self.maxDistance + 1):
+            for number, (_, piece) in enumerate(partitionName(name, distance + 1)):
+                yield (distance, len(name), number, piece)
+    def add(self, name): # indexes a name under each of its pieces, ignoring names already present.
+        if name in self.names:
+            return
+        self.names.add(name)
+        for key in self.keys(name):
+            self.postings.setdefault(key, set()).add(name)
+    def remove(self, name): # drops a name from every posting it appears in.
+        if name not in self.names:
+            return
+        self.names.discard(name)
+        for key in self.keys(name):
+            posting = self.postings[key]
+            posting.discard(name)
+            if not posting:
+                del self.postings[key]
+    def search(self, query, maxDistance): # returns (distance, name) pairs for every name within maxDistance of query.
+        if maxDistance == 0:
+            return [(0, query)] if query in self.names else []
+        if maxDistance > self.maxDistance:
+            candidates = self.names  # no partition for this distance, so every name has to be checked
+        else:
+            candidates = set()
+            for length in range(max(0, len(query) - maxDistance), len(query) + maxDistance + 1):
+                delta = len(query) - length
+                slack = (maxDistance - abs(delta)) // 2
+                bounds = partitionBounds(length, maxDistance + 1)
+                for number in range(maxDistance + 1):
+                    start, pieceLength = bounds[number], bounds[number + 1] - bounds[number]
+                    # some unchanged piece also has at most `number` edits before it and maxDistance - number after it
+                    lowest = max(0, start + min(0, delta) - slack, start - number, start + delta - (maxDistance - number))
+                    highest = min(len(query) - pieceLength, start + max(0, delta) + slack, start + number,
+                                  start + delta + (maxDistance - number))
+                    for position in range(lowest, highest + 1):
+                        posting = self.postings.get((maxDistance, length, number, query[position:position + pieceLength]))
+                        if posting:
+                            candidates.update(posting)
+        masks = patternMasks(query)
+        matches = []
+        for name in candidates:
+            distance = bitEditDistance(masks, len(query), name)
+            if distance <= maxDistance:
+                matches.append((distance, name))
+        return matches
+
+# — Compact Columnar Storage
+#The Class CompactMarketplace
+# - stores the catalog as parallel typed arrays instead of one dict per item: ids and prices in array columns,
+#   names packed into a single UTF-8 buffer with an offsets column, and a sorted hash column for name lookups
+class CompactMarketplace:
+    def __init__(self, db=(), hashName=hash): # packs a list of item dicts into columns, preserving list order.
+        db = list(db)
+        self.hashName = hashName
+        self.ids = array("q", (item["id"] for item in db))
+        isIntegral = all(isinstance(item["price"], int) for item in db)
+        self.prices = array("q" if isIntegral else "d", (item["price"] for item in db))
+        encodedNames = [item["name"].encode("utf-8") for item in db]
+        self.nameOffsets = array("q", [0])
+        for encoded in encodedNames:
+            self.nameOffsets.append(self.nameOffsets[-1] + len(encoded))
+        self.nameData = b"".join(encodedNames)
+        # rows ordered by (name hash, row) so the first hit for a name is also the first in list order
+        hashedRows = sorted((hashName(foldName(item["name"])), row) for row, item in enumerate(db))
+        self.nameHashes = array("q", (nameHash for nameHash, _ in hashedRows))
+        self.hashRows = array("q", (row for _, row in hashedRows))
+    def __len__(self):
+        return len(self.ids)
+    def __iter__(self):
+        return (self.record(row) for row in range(len(self.ids)))
+    def nameAt(self, row): # decodes one name out of the packed name buffer.
+        return str(self.nameData[self.nameOffsets[row]:self.nameOffsets[row + 1]], "utf-8")
+    def record(self, row): # rebuilds the item dict for one row, in the same shape as the marketplace entries.
+        return {"id": self.ids[row], "name": self.nameAt(row), "price": self.prices[row]}
+    def findByName(self, target): # same result as linearSearch(db, target), built fresh from the columns.
+        key = foldName(target)
+        nameHash = self.hashName(key)
+        position = bisect_left(self.nameHashes, nameHash)
+        while position < len(self.nameHashes) and self.nameHashes[position] == nameHash:
+            row = self.hashRows[position]
+            if foldName(self.nameAt(row)) == key:  # equal hashes can still be different names
+                return self.record(row)
+            position += 1
+        return None
+
+# — Memory-Mapped Catalog
+#File layout: a fixed header, then the CompactMarketplace columns back to back (ids, prices, name offsets,
+#name hashes, hash rows, name bytes). Every column holds 8-byte values so each one stays 8-byte aligned.
+catalogMagic = b"KCMK"
+catalogVersion = 1
+catalogHeader = struct.Struct("<4sHBBqq")  # magic, version, price typecode ("q"/"d"), byte order (0 little, 1 big), count, name bytes
+
+#Hashes a folded name to a signed 64-bit int that stays the same across processes (unlike hash())
+def stableNameHash(key):
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little", signed=True)
+
+#Writes the catalog and its name index to path in the MappedCatalog format
+def writeCatalog(path, db):
+    compact = CompactMarketplace(db, hashName=stableNameHash)
+    with open(path, "wb") as catalogFile:
+        catalogFile.write(catalogHeader.pack(catalogMagic, catalogVersion, ord(compact.prices.typecode),
+                                             sys.byteorder == "big", len(compact), len(compact.nameData)))
+        for column in (compact.ids, compact.prices, compact.nameOffsets, compact.nameHashes, compact.hashRows):
+            column.tofile(catalogFile)
+        catalogFile.write(compact.nameData)
+
+#The Class MappedCatalog
+# - opens a catalog written by writeCatalog with mmap and reads columns straight from the mapped pages, so opening
+#   costs the same at any size and a lookup only touches the pages it needs
+class MappedCatalog(CompactMarketplace):
+    def __init__(self, path): # maps the file and wraps each column in a zero-copy memoryview; no records are loaded.
+        with open(path, "rb") as catalogFile:
+            self.map = mmap.mmap(catalogFile.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, priceType, bigEndian, count, nameBytes = catalogHeader.unpack_from(self.map)
+        if magic != catalogMagic or version != catalogVersion:
+            self.map.close()
+            raise ValueError(f"{path} is not a version {catalogVersion} marketplace catalog.")
+        if bigEndian != (sys.byteorder == "big"):
+            self.map.close()
+            raise ValueError(f"{path} was written on a machine with a different byte order.")
+        self.hashName = stableNameHash
+        self.view = memoryview(self.map)
+        offset = catalogHeader.size
+        columns = []
+        for typecode, length in (("q", count), (chr(priceType), count), ("q", count + 1), ("q", count), ("q", count)):
+            columns.append(self.view[offset:offset + 8 * length].cast(typecode))
+            offset += 8 * length
+        self.ids, self.prices, self.nameOffsets, self.nameHashes, self.hashRows = columns
+        self.nameData = self.view[offset:offset + nameBytes]
+    def close(self): # releases the column views before unmapping, since mmap refuses to close while they exist.
+        for column in (self.ids, self.prices, self.nameOffsets, self.nameHashes, self.hashRows, self.nameData, self.view):
+            column.release()
+        self.map.close()
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc):
+        self.close()
+
 marketplace = [
     {"id": 1, "name": "Laptop", "price": 1000},
     {"id": 2, "name": "Smartphone", "price": 500},
@@ -11,8 +406,195 @@ marketplace = [
     {"id": 4, "name": "Keyboard", "price": 70},
 ]
 
-requestedItem = input("Hello! What item are you looking for in the marketplace?")
-result = linearSearch(marketplace, requestedItem)
+# — Benchmarks
+#Generates a synthetic catalog with unique names so lookups can be timed at large sizes
+def generateMarketplace(size):
+    return [{"id": i, "name": f"Item {i}", "price": random.randint(1, 2000)} for i in range(1, size + 1)]
+
+#Compares linearSearch against MarketplaceIndex lookups (worst case for the scan: last item and a missing item)
+def benchmarkMarketplaceIndex(sizes=(1000, 100000, 1000000), lookups=1000):
+    print(f"{'Items':>10} {'Build (s)':>12} {'linearSearch (s)':>18} {'Index lookup (s)':>18} {'Speedup':>10}")
+    for size in sizes:
+        db = generateMarketplace(size)
+        targets = [db[-1]["name"].upper(), "not in the catalog"]
+
+        startTime = time.perf_counter()
+        catalog = MarketplaceIndex(db)
+        buildTime = time.perf_counter() - startTime
+
+        startTime = time.perf_counter()
+        for target in targets:
+            linearSearch(db, target)
+        scanTime = (time.perf_counter() - startTime) / len(targets)
+
+        startTime = time.perf_counter()
+        for _ in range(lookups):
+            for target in targets:
+                catalog.findByName(target)
+        indexTime = (time.perf_counter() - startTime) / (lookups * len(targets))
+
+        print(f"{size:>10} {buildTime:>12.6f} {scanTime:>18.9f} {indexTime:>18.9f} {scanTime / indexTime:>9.0f}x")
+
+#Baseline for find(): scans every item, filters, then orders the matches by price
+def scanFind(db, namePrefix=None, minPrice=None, maxPrice=None, limit=None):
+    key = None if namePrefix is None else foldName(namePrefix)
+    matches = [item for item in db
+               if (minPrice is None or item["price"] >= minPrice)
+               and (maxPrice is None or item["price"] <= maxPrice)
+               and (key is None or foldName(item["name"]).startswith(key))]
+    return sorted(matches, key=lambda item: (item["price"], item["id"]))[:limit]
+
+#Compares find() range queries against scanFind on the same filters
+def benchmarkPriceQueries(sizes=(1000, 100000, 1000000), queries=100):
+    print(f"{'Items':>10} {'Query':>28} {'Scan (ms)':>12} {'Index (ms)':>12} {'Speedup':>10}")
+    for size in sizes:
+        db = generateMarketplace(size)
+        catalog = MarketplaceIndex(db)
+        cases = {
+            "price 100-110": {"minPrice": 100, "maxPrice": 110},
+            "price 100-500, limit 20": {"minPrice": 100, "maxPrice": 500, "limit": 20},
+            "prefix 'item 9', <= 50": {"namePrefix": "item 9", "maxPrice": 50},
+            "prefix 'item 12345', any": {"namePrefix": "item 12345"},
+        }
+        for label, filters in cases.items():
+            scanQueries = max(1, queries * 1000 // size)  # keep the O(n) baseline affordable at 1M items
+            startTime = time.perf_counter()
+            for _ in range(scanQueries):
+                expected = scanFind(db, **filters)
+            scanTime = (time.perf_counter() - startTime) * 1000 / scanQueries
+
+            startTime = time.perf_counter()
+            for _ in range(queries):
+                result = catalog.find(**filters)
+            indexTime = (time.perf_counter() - startTime) * 1000 / queries
+
+            assert result == expected
+            print(f"{size:>10} {label:>28} {scanTime:>12.4f} {indexTime:>12.4f} {scanTime / indexTime:>9.0f}x")
+
+#Measures the memory retained by the list-of-dicts layout and by CompactMarketplace for the same catalog
+def reportCatalogMemory(size=1000000):
+    tracemalloc.start()
+    db = generateMarketplace(size)
+    dictBytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    compact = CompactMarketplace(db)
+    compactBytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    for target in (db[0]["name"], db[-1]["name"].upper(), "not in the catalog"):
+        assert compact.findByName(target) == linearSearch(db, target)
+
+    perMillion = 1000000 / size
+    print(f"\nMemory for {size} items:")
+    print(f"  List of dicts:      {dictBytes / size:>8.1f} bytes/item, {dictBytes * perMillion / 2**20:>8.1f} MiB per 1M items")
+    print(f"  CompactMarketplace: {compactBytes / size:>8.1f} bytes/item, {compactBytes * perMillion / 2**20:>8.1f} MiB per 1M items")
+    print(f"  Reduction: {dictBytes / compactBytes:.1f}x")
+
+#Compares opening a MappedCatalog (plus a first lookup) against parsing the same catalog from JSON at startup
+def benchmarkMappedCatalog(sizes=(1000, 100000, 1000000)):
+    print(f"\n{'Items':>10} {'JSON load (s)':>14} {'mmap open (s)':>14} {'First lookup (ms)':>18}")
+    with tempfile.TemporaryDirectory() as workDir:
+        for size in sizes:
+            db = generateMarketplace(size)
+            jsonPath = os.path.join(workDir, f"catalog{size}.json")
+            catalogPath = os.path.join(workDir, f"catalog{size}.kcmk")
+            with open(jsonPath, "w") as jsonFile:
+                json.dump(db, jsonFile)
+            writeCatalog(catalogPath, db)
+
+            startTime = time.perf_counter()
+            with open(jsonPath) as jsonFile:
+                json.load(jsonFile)
+            jsonTime = time.perf_counter() - startTime
+
+            startTime = time.perf_counter()
+            catalog = MappedCatalog(catalogPath)
+            openTime = time.perf_counter() - startTime
+            startTime = time.perf_counter()
+            result = catalog.findByName(db[-1]["name"])
+            lookupTime = (time.perf_counter() - startTime) * 1000
+            assert result == db[-1]
+            catalog.close()
+
+            print(f"{size:>10} {jsonTime:>14.6f} {openTime:>14.6f} {lookupTime:>18.4f}")
+
+#Times 10k lookups against a 1M-item catalog: one linearSearch per name (extrapolated from a sample) versus batchSearch
+def benchmarkBatchSearch(size=1000000, numQueries=10000, sampledScans=5, workers=4):
+    db = generateMarketplace(size)
+    targets = [item["name"].upper() for item in random.sample(db, numQueries * 9 // 10)]
+    targets += [f"missing item {i}" for i in range(numQueries - len(targets))]
+    random.shuffle(targets)
+
+    startTime = time.perf_counter()
+    for target in targets[:sampledScans]:
+        linearSearch(db, target)
+    scanTime = (time.perf_counter() - startTime) / sampledScans * numQueries
+
+    timings = {}
+    startTime = time.perf_counter()
+    expected = batchSearch(db, targets)
+    timings["batchSearch, one pass"] = time.perf_counter() - startTime
+    startTime = time.perf_counter()
+    assert batchSearch(db, targets, workers=workers) == expected
+    timings[f"batchSearch, {workers} threads"] = time.perf_counter() - startTime
+    startTime = time.perf_counter()
+    catalog = MarketplaceIndex(db)
+    assert batchSearch(catalog, targets) == expected
+    timings["batchSearch, index (incl. build)"] = time.perf_counter() - startTime
+    startTime = time.perf_counter()
+    batchSearch(catalog, targets)
+    timings["batchSearch, prebuilt index"] = time.perf_counter() - startTime
+
+    print(f"\n{numQueries} queries against {size} items:")
+    print(f"  {'linearSearch per query (est.)':<34} {scanTime:>12.3f} s")
+    for label, elapsed in timings.items():
+        print(f"  {label:<34} {elapsed:>12.3f} s  ({scanTime / elapsed:,.0f}x)")
+
+#Generates a random lowercase product-like name (the "Item N" names are too alike for a fair fuzzy benchmark)
+def randomName(minLength=5, maxLength=12):
+    return "".join(random.choices(string.ascii_lowercase, k=random.randint(minLength, maxLength)))
+
+#Times autocomplete and fuzzy lookups, reporting the mean latency per query in milliseconds
+def benchmarkNameSearch(sizes=(1000, 100000, 1000000), queries=200):
+    print(f"{'Items':>10} {'Build (s)':>12} {'Prefix (ms)':>12} {'Fuzzy d=1 (ms)':>15} {'Fuzzy d=2, 6+ chars (ms)':>25}")
+    for size in sizes:
+        db = [{"id": i, "name": randomName(), "price": random.randint(1, 2000)} for i in range(1, size + 1)]
+        startTime = time.perf_counter()
+        catalog = MarketplaceIndex(db)
+        buildTime = time.perf_counter() - startTime
+
+        samples = random.sample(db, min(queries, size))
+        prefixes = [item["name"][:3] for item in samples]
+        typos = [item["name"][:2] + item["name"][3:] for item in samples]  # drop one character
+        longTypos = [typo for typo in typos if len(typo) > 5]  # fuzzySearch only allows 2 edits past 5 characters
+
+        latencies = []
+        for search, args in ((catalog.autocomplete, [(prefix,) for prefix in prefixes]),
+                             (catalog.fuzzySearch, [(typo, 1) for typo in typos]),
+                             (catalog.fuzzySearch, [(typo, 2) for typo in longTypos])):
+            startTime = time.perf_counter()
+            for queryArgs in args:
+                search(*queryArgs)
+            latencies.append((time.perf_counter() - startTime) * 1000 / len(args))
+
+        print(f"{size:>10} {buildTime:>12.3f} {latencies[0]:>12.4f} {latencies[1]:>15.4f} {latencies[2]:>25.4f}")
 
-print(f"Item found: {result}" if result else "Item not found.")
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmarkMarketplaceIndex()
+        benchmarkNameSearch()
+        benchmarkPriceQueries()
+        reportCatalogMemory()
+        benchmarkMappedCatalog()
+        benchmarkBatchSearch()
+    else:
+        if "--catalog" in sys.argv:  # look items up in an on-disk catalog written by writeCatalog
+            catalog = MappedCatalog(sys.argv[sys.argv.index("--catalog") + 1])
+        else:
+            catalog = MarketplaceIndex(marketplace)
+        requestedItem = input("Hello! What item are you looking for in the marketplace?")
+        result = catalog.findByName(requestedItem)
 
+        print(f"Item found: {result}" if result else "Item not found.")
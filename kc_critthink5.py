@@ -1,11 +1,20 @@
-from collections import defaultdict
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import sparse
 
 # Dictionary to store user preferences
-# Each user has a list of liked and disliked post IDs
+# Each user has a set of liked and disliked post IDs (a tag-count profile is added below)
 users = {
-    1: {'liked': [101, 102], 'disliked': [103]},
-    2: {'liked': [101, 104], 'disliked': []},
-    3: {'liked': [102, 105], 'disliked': [101]},
+    1: {'liked': {101, 102}, 'disliked': {103}},
+    2: {'liked': {101, 104}, 'disliked': set()},
+    3: {'liked': {102, 105}, 'disliked': {101}},
 }
 
 # Dictionary to store content details
@@ -24,27 +33,140 @@ for postID, details in content.items():
     for tag in details['tags']:
         tagToContent[tag].add(postID)
 
-def recommendContent(userID, users, content):
+# Turns a user's liked and disliked post IDs into sets and adds their tag-count profile:
+# 'tagCounts' maps each tag to how many of the user's liked posts carry it
+def buildUserProfile(preferences, content):
+    preferences['liked'] = set(preferences['liked'])
+    preferences['disliked'] = set(preferences['disliked'])
+    preferences['tagCounts'] = Counter()
+    for postID in preferences['liked']:
+        adjustTagCounts(preferences['tagCounts'], postID, content, 1)
+    return preferences
+
+# Adds (delta = 1) or removes (delta = -1) one liked post's tags from a tag-count profile, dropping tags that reach zero
+def adjustTagCounts(tagCounts, postID, content, delta):
+    if postID not in content:
+        return
+    for tag in set(content[postID]['tags']):
+        tagCounts[tag] += delta
+        if tagCounts[tag] <= 0:
+            del tagCounts[tag]
+
+# Profile every user up front; updateUserPreferences keeps the profiles current from then on
+for preferences in users.values():
+    buildUserProfile(preferences, content)
+
+# LRU cache of per-user recommendation lists with a time-to-live
+# - holds at most maxEntries users and maxItems titles in total, evicting least recently used users until both fit
+# - a list longer than maxItems on its own is not cached at all
+# - each entry remembers the liked tags it was computed from, so adding a post only invalidates users whose tags it shares
+# - hits, misses, evictions, expirations and invalidations are counted for monitoring
+class RecommendationCache:
+    def __init__(self, maxEntries=10000, maxItems=1000000, ttl=300.0, clock=time.monotonic):
+        self.maxEntries = maxEntries
+        self.maxItems = maxItems
+        self.totalItems = 0  # titles held across all entries
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()  # userID -> (expiry time, recommendations, liked tags), least recently used first
+        self.usersByTag = defaultdict(set)  # tag -> cached users whose liked tags include it
+        self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    # Returns the cached list for userID, or None (counting a miss) when there is no live entry
+    def get(self, userID):
+        entry = self.entries.get(userID)
+        if entry is not None and entry[0] <= self.clock():
+            self.discard(userID)
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(userID)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, userID, recommendations, likedTags):
+        self.discard(userID)
+        if len(recommendations) > self.maxItems:
+            return
+        while self.entries and (len(self.entries) >= self.maxEntries
+                                or self.totalItems + len(recommendations) > self.maxItems):
+            self.discard(next(iter(self.entries)))
+            self.evictions += 1
+        self.totalItems += len(recommendations)
+        likedTags = frozenset(likedTags)
+        self.entries[userID] = (self.clock() + self.ttl, recommendations, likedTags)
+        for tag in likedTags:
+            self.usersByTag[tag].add(userID)
+
+    # Drops userID's entry (if any) and its tag links; returns whether there was one
+    def discard(self, userID):
+        entry = self.entries.pop(userID, None)
+        if entry is None:
+            return False
+        self.totalItems -= len(entry[1])
+        for tag in entry[2]:
+            tagUsers = self.usersByTag[tag]
+            tagUsers.discard(userID)
+            if not tagUsers:
+                del self.usersByTag[tag]
+        return True
+
+    def invalidateUser(self, userID):
+        if self.discard(userID):
+            self.invalidations += 1
+
+    # Invalidates every cached user whose liked tags include any of tags
+    def invalidateTags(self, tags):
+        affected = set()
+        for tag in tags:
+            affected |= self.usersByTag.get(tag, set())
+        for userID in affected:
+            self.invalidateUser(userID)
+
+    def stats(self):
+        return {'entries': len(self.entries), 'items': self.totalItems, 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'expirations': self.expirations, 'invalidations': self.invalidations}
+
+# Shared cache for the global users and content; updateUserPreferences and addContent keep it consistent
+recommendationCache = RecommendationCache()
+
+def recommendContent(userID, users, content, tagIndex=None):
+    # Use the global tag index unless one is given for this content
+    if tagIndex is None:
+        tagIndex = tagToContent
+
     # Check if the user exists in the users dictionary
     if userID not in users:
         return "User  not found."
 
-    # Retrieve liked and disliked content for the user
-    likedContent = users[userID]['liked']
-    dislikedContent = set(users[userID]['disliked'])
-    likedTags = set()
+    preferences = users[userID]
+    if 'tagCounts' in preferences:
+        # Profiled users already have sets and their liked tags, so the cost depends on the profile, not the like history
+        likedContent = preferences['liked']
+        dislikedContent = preferences['disliked']
+        likedTags = preferences['tagCounts'].keys()
+    else:
+        # Retrieve liked and disliked content for the user
+        likedContent = set(preferences['liked'])
+        dislikedContent = set(preferences['disliked'])
+        likedTags = set()
 
-    # Collect all tags from the content that the user has liked
-    for postID in likedContent:
-        if postID in content:
-            likedTags.update(content[postID]['tags'])
+        # Collect all tags from the content that the user has liked
+        for postID in likedContent:
+            if postID in content:
+                likedTags.update(content[postID]['tags'])
 
     recommendations = set()
 
     # Recommend content that shares tags with liked content
     # Exclude posts that the user has already liked or disliked
     for tag in likedTags:
-        for postID in tagToContent[tag]:
+        for postID in tagIndex.get(tag, ()):
             if postID not in likedContent and postID not in dislikedContent:
                 recommendations.add(postID)
 
@@ -54,35 +176,438 @@ def recommendContent(userID, users, content):
 def updateUserPreferences(userID, actions):
     # Check if the user exists in the users dictionary
     if userID in users:
-        # Process each action (like or dislike) for the specified post IDs
+        preferences = users[userID]
+        if 'tagCounts' not in preferences:
+            buildUserProfile(preferences, content)
+        changed = False
+        # Process each action (like or dislike) for the specified post IDs; each one costs O(tags per post)
         for action, postID in actions:
             if action == 'like':
-                # Add postID to liked list if not already liked
-                if postID not in users[userID]['liked']:
-                    users[userID]['liked'].append(postID)
+                # Add postID to liked set if not already liked
+                if postID not in preferences['liked']:
+                    preferences['liked'].add(postID)
+                    adjustTagCounts(preferences['tagCounts'], postID, content, 1)
+                    changed = True
                     print(f"User  {userID} liked Post ID {postID}: '{content[postID]['title']}'")
-                # Remove postID from disliked list if it was previously disliked
-                if postID in users[userID]['disliked']:
-                    users[userID]['disliked'].remove(postID)
+                # Remove postID from disliked set if it was previously disliked
+                if postID in preferences['disliked']:
+                    preferences['disliked'].remove(postID)
+                    changed = True
                     print(f"User  {userID} removed Post ID {postID} from dislikes.")
             elif action == 'dislike':
-                # Add postID to disliked list if not already disliked
-                if postID not in users[userID]['disliked']:
-                    users[userID]['disliked'].append(postID)
+                # Add postID to disliked set if not already disliked
+                if postID not in preferences['disliked']:
+                    preferences['disliked'].add(postID)
+                    changed = True
                     print(f"User  {userID} disliked Post ID {postID}: '{content[postID]['title']}'")
-                # Remove postID from liked list if it was previously liked
-                if postID in users[userID]['liked']:
-                    users[userID]['liked'].remove(postID)
+                # Remove postID from liked set if it was previously liked
+                if postID in preferences['liked']:
+                    preferences['liked'].remove(postID)
+                    adjustTagCounts(preferences['tagCounts'], postID, content, -1)
+                    changed = True
                     print(f"User  {userID} removed Post ID {postID} from likes.")
+        # The user's cached recommendations are stale once their preferences change
+        if changed:
+            recommendationCache.invalidateUser(userID)
+
+# recommendContent for the global users and content, served from recommendationCache when possible
+def cachedRecommendContent(userID):
+    recommendations = recommendationCache.get(userID)
+    if recommendations is None:
+        if userID in users and 'tagCounts' not in users[userID]:
+            buildUserProfile(users[userID], content)
+        recommendations = recommendContent(userID, users, content)
+        if userID in users:
+            recommendationCache.put(userID, recommendations, users[userID]['tagCounts'])
+    return recommendations
+
+# Adds a post to content and tagToContent, invalidating the cached users who like any of its tags
+def addContent(postID, title, tags):
+    if postID in content:
+        raise ValueError(f"Post ID {postID} is already in content.")
+    content[postID] = {'title': title, 'tags': list(tags)}
+    for tag in tags:
+        tagToContent[tag].add(postID)
+    recommendationCache.invalidateTags(tags)
+
+# Vectorized recommendation engine
+# - holds user x post likes and dislikes and post x tag membership as CSR sparse matrices, built once from users and content
+# - a user's liked tags come from their tag-count profile (or, without one, from one sparse row product), and every
+#   candidate's score (the number of liked tags it shares) from one sparse vector-matrix product, so only posts under
+#   the user's liked tags are touched
+# - profiles and liked/disliked sets are read live, so updateUserPreferences changes show up without a rebuild
+class SparseRecommender:
+    def __init__(self, users, content):
+        self.users = users
+        self.content = content
+        self.postIDs = np.array(list(content))
+        self.postIndex = {postID: i for i, postID in enumerate(self.postIDs.tolist())}
+        # Ranking key = score * posts + (posts - 1 - rank of the post ID), so ties go to the smaller post ID and
+        # every key is unique, which makes argpartition's choice deterministic
+        self.tieBreak = np.empty(len(self.postIDs), dtype=np.int64)
+        self.tieBreak[np.argsort(self.postIDs, kind='stable')] = np.arange(len(self.postIDs) - 1, -1, -1)
+        self.userIDs = list(users)
+        self.userIndex = {userID: i for i, userID in enumerate(self.userIDs)}
+        tagIndex = {}
+        tagRows, tagColumns = [], []
+        for row, details in enumerate(content.values()):
+            for tag in dict.fromkeys(details['tags']):  # dedupes in order, so tag columns do not depend on hash seeds
+                tagRows.append(row)
+                tagColumns.append(tagIndex.setdefault(tag, len(tagIndex)))
+        self.tagIndex = tagIndex
+        self.postTags = self.binaryMatrix(tagRows, tagColumns, (len(content), len(tagIndex)))
+        self.tagPosts = self.postTags.T.tocsr()  # tag x post, so a tag vector times it scores posts directly
+        self.likes = self.interactionMatrix(users, 'liked')
+        self.dislikes = self.interactionMatrix(users, 'disliked')
+
+    @staticmethod
+    def binaryMatrix(rows, columns, shape):
+        return sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, columns)), shape=shape)
+
+    # Builds a user x post matrix from each user's liked or disliked post IDs, skipping posts not in content
+    def interactionMatrix(self, users, kind):
+        rows, columns = [], []
+        for row, preferences in enumerate(users.values()):
+            for postID in preferences[kind]:
+                column = self.postIndex.get(postID)
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+        matrix = self.binaryMatrix(rows, columns, (len(users), len(self.postIDs)))
+        matrix.data[:] = 1  # a post listed twice still counts once
+        return matrix
+
+    # Scores every candidate post for one user: returns (post indices, scores), unordered
+    def scoreCandidates(self, userID):
+        preferences = self.users[userID]
+        if 'tagCounts' not in preferences and userID not in self.userIndex:
+            buildUserProfile(preferences, self.content)  # added after construction, so it has no matrix row
+        if 'tagCounts' in preferences:
+            columns = [self.tagIndex[tag] for tag in preferences['tagCounts'] if tag in self.tagIndex]
+            likedTags = self.binaryMatrix([0] * len(columns), columns, (1, len(self.tagIndex)))
+            seen = [self.postIndex[postID] for kind in ('liked', 'disliked') for postID in preferences[kind]
+                    if postID in self.postIndex]
+        else:
+            row = self.userIndex[userID]
+            likedTags = self.likes[row] @ self.postTags
+            likedTags.data[:] = 1  # each liked tag counts once, however many liked posts carry it
+            seen = np.concatenate((self.likes[row].indices, self.dislikes[row].indices))
+        scores = likedTags @ self.tagPosts
+        candidates, values = scores.indices, scores.data
+        keep = ~np.isin(candidates, seen)
+        return candidates[keep], values[keep]
+
+    # Returns up to k titles ranked by tag overlap (ties by post ID), or all of them when k is None
+    def recommend(self, userID, k=10):
+        if userID not in self.users:
+            return "User  not found."
+        return self.rankTitles(*self.scoreCandidates(userID), k)
+
+    # Picks the k best-scoring candidates with argpartition and returns their titles, best first (ties by post ID)
+    def rankTitles(self, candidates, scores, k):
+        keys = scores.astype(np.int64) * len(self.postIDs) + self.tieBreak[candidates]
+        if k is not None and len(candidates) > k:
+            top = np.argpartition(-keys, k - 1)[:k]
+            candidates, keys = candidates[top], keys[top]
+        return self.titlesOf(candidates[np.argsort(-keys)])
+
+    def titlesOf(self, postRows):
+        return [self.content[postID]['title'] for postID in self.postIDs[postRows].tolist()]
+
+    # Recommendations for the users in rows start..stop as JSON lines, scored with one batched product:
+    # (users x posts likes) x (post x tag) gives the liked tags, then x (tag x post) scores every post for every user
+    # in a dense users x posts block of int64 keys, the only full-size array (8 bytes per post per row); top-k then
+    # partitions it one row at a time, so its index arrays stay one row long.
+    # Uses the likes and dislikes as of construction, like a nightly snapshot
+    def recommendRows(self, start, stop, k):
+        numPosts = len(self.postIDs)
+        likedTags = (self.likes[start:stop] @ self.postTags).astype(np.int64)
+        likedTags.data[:] = 1
+        # Ranking keys as in rankTitles, negated so the best post has the smallest key. The post x user product is int64
+        # already and its transpose is the users x posts block, so the block is built in place and never copied
+        # (likedTags goes in as a C-ordered int64 tag x user array, which the product uses without another copy).
+        # Posts sharing no liked tag get keys above -numPosts
+        keys = (self.postTags @ likedTags.T.tocsr().toarray()).T
+        keys *= -numPosts
+        keys -= self.tieBreak
+        seen = (self.likes[start:stop] + self.dislikes[start:stop]).tocoo()
+        keys[seen.row, seen.col] = 1  # drop posts the user already liked or disliked
+        if k is not None and k < numPosts:
+            top = np.empty((stop - start, k), dtype=np.int64)
+            for row in range(stop - start):
+                top[row] = np.argpartition(keys[row], k - 1)[:k]
+        else:
+            top = np.broadcast_to(np.arange(numPosts), keys.shape)
+        topKeys = np.take_along_axis(keys, top, axis=1)
+        order = np.argsort(topKeys, axis=1)
+        top, topKeys = np.take_along_axis(top, order, axis=1), np.take_along_axis(topKeys, order, axis=1)
+        lines = []
+        for row, userID in enumerate(self.userIDs[start:stop]):
+            titles = self.titlesOf(top[row][topKeys[row] <= -numPosts])
+            lines.append(json.dumps({'userID': userID, 'recommendations': titles}) + "\n")
+        return "".join(lines)
+
+# Each worker process gets its own copy of the recommender once, instead of one per chunk
+workerRecommender = None
+
+def initRecommendWorker(recommender):
+    global workerRecommender
+    workerRecommender = recommender
+
+def recommendRowsInWorker(start, stop, k):
+    return workerRecommender.recommendRows(start, stop, k)
+
+# Precomputes the top-k recommendations of every user and streams them to outputPath as JSON lines
+# ({"userID": ..., "recommendations": [titles]}), chunkSize users at a time (by default as many as keep recommendRows'
+# tracemalloc peak under 64 MB: 8 bytes per post and per tag for each row, plus fixedBytes per chunk);
+# with workers > 1 the chunks are scored in a process pool and written back in user order.
+# Returns the number of users written
+def recommendAll(users, content, k=10, outputPath="recommendations.jsonl", chunkSize=None, workers=1):
+    recommender = SparseRecommender(users, content)
+    numPosts, numTags = max(1, len(content)), len(recommender.tagIndex)
+    # the product's int64 copy of postTags' data, two rows of top-k scratch, and 1 MB for the small sparse temporaries
+    fixedBytes = 8 * recommender.postTags.nnz + 16 * numPosts + 2**20
+    chunkSize = chunkSize or max(1, (64 * 2**20 - fixedBytes) // (8 * numPosts + 8 * numTags))
+    chunks = [(start, min(start + chunkSize, len(users))) for start in range(0, len(users), chunkSize)]
+    with open(outputPath, "w") as outFile:
+        if workers > 1 and chunks:
+            with ProcessPoolExecutor(workers, initializer=initRecommendWorker, initargs=(recommender,)) as pool:
+                for lines in pool.map(recommendRowsInWorker, *zip(*[(start, stop, k) for start, stop in chunks])):
+                    outFile.write(lines)
+        else:
+            for start, stop in chunks:
+                outFile.write(recommender.recommendRows(start, stop, k))
+    return len(users)
+
+# Approximate recommendation engine: MinHash signatures of each distinct tag set, bucketed with LSH banding
+# - posts with the same tag set form one group, so a popular tag set is one bucket entry instead of thousands of posts
+# - each of bands x rows hash functions maps a tag set to its smallest tag hash; two sets agree on one with
+#   probability equal to their Jaccard similarity
+# - a band is rows consecutive hashes, and groups whose whole band matches share a bucket, so tag sets with Jaccard
+#   similarity J collide in at least one band with probability 1 - (1 - J^rows)^bands
+# - a user's candidate groups are the bucket-mates of their liked posts' groups, scored by how many (liked post, band)
+#   buckets they share; top-k then reads only the best posts of the best groups, so a query never walks every post
+#   under a popular tag
+# More bands or fewer rows per band raise recall and the number of candidates scanned; fewer bands or more rows cut latency
+class MinHashRecommender(SparseRecommender):
+    prime = 2**31 - 1
+
+    def __init__(self, users, content, bands=16, rows=2, seed=0):
+        super().__init__(users, content)
+        self.bands, self.rows = bands, rows
+        rng = np.random.default_rng(seed)
+        multipliers = rng.integers(1, self.prime, size=(bands * rows, 1))
+        offsets = rng.integers(0, self.prime, size=(bands * rows, 1))
+        tagHashes = (multipliers * np.arange(len(self.tagIndex)) + offsets) % self.prime
+
+        # Group posts by tag set (postTags rows hold each post's sorted tag columns); posts without tags get no group
+        indptr, tagColumns = self.postTags.indptr, self.postTags.indices
+        groupIndex = {}
+        self.postGroup = np.full(len(self.postIDs), -1)
+        for row in np.flatnonzero(np.diff(indptr)).tolist():
+            tagSet = tuple(tagColumns[indptr[row]:indptr[row + 1]].tolist())
+            self.postGroup[row] = groupIndex.setdefault(tagSet, len(groupIndex))
+        # Members of each group, best ranked first (highest tie-break), stored CSR-style
+        grouped = np.flatnonzero(self.postGroup >= 0)
+        self.groupMembers = grouped[np.lexsort((-self.tieBreak[grouped], self.postGroup[grouped]))]
+        self.groupStarts = np.concatenate(([0], np.cumsum(np.bincount(self.postGroup[grouped], minlength=len(groupIndex)))))
+
+        groupColumns = np.fromiter((column for tagSet in groupIndex for column in tagSet), dtype=np.int64)
+        groupOffsets = np.concatenate(([0], np.cumsum([len(tagSet) for tagSet in groupIndex])[:-1])).astype(np.int64)
+        # No tagged posts means no groups to sign and no buckets; every query then finds no candidates
+        self.bandKeys, self.sortedKeys, self.bucketGroups = [], [], []
+        for band in range(bands if groupIndex else 0):
+            signature = np.minimum.reduceat(tagHashes[band * rows:(band + 1) * rows][:, groupColumns], groupOffsets, axis=1)
+            keys = np.zeros(len(groupIndex), dtype=np.uint64)
+            for hashValues in signature.astype(np.uint64):
+                keys = keys * np.uint64(1000003) + hashValues  # wraps mod 2^64
+            order = np.argsort(keys, kind='stable')
+            self.bandKeys.append(keys)
+            self.sortedKeys.append(keys[order])
+            self.bucketGroups.append(order)
+
+    # Candidate groups are bucket-mates of the user's liked posts' groups; returns (groups, shared bucket counts)
+    def candidateGroups(self, preferences):
+        likedRows = [self.postIndex[postID] for postID in preferences['liked'] if postID in self.postIndex]
+        likedGroups = self.postGroup[likedRows]
+        likedGroups = likedGroups[likedGroups >= 0]
+        buckets = []
+        for keys, sortedKeys, members in zip(self.bandKeys, self.sortedKeys, self.bucketGroups):
+            wanted = keys[likedGroups]
+            lows, highs = np.searchsorted(sortedKeys, wanted, 'left'), np.searchsorted(sortedKeys, wanted, 'right')
+            buckets.extend(members[low:high] for low, high in zip(lows.tolist(), highs.tolist()))
+        if not buckets:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        votes = np.bincount(np.concatenate(buckets), minlength=len(self.groupStarts) - 1)
+        groups = np.flatnonzero(votes)
+        return groups, votes[groups]
+
+    def seenRows(self, preferences):
+        return {self.postIndex[postID] for kind in ('liked', 'disliked') for postID in preferences[kind]
+                if postID in self.postIndex}
+
+    # Every candidate post with its group's score (expands all candidate groups)
+    def scoreCandidates(self, userID):
+        preferences = self.users[userID]
+        groups, votes = self.candidateGroups(preferences)
+        sizes = self.groupStarts[groups + 1] - self.groupStarts[groups]
+        candidates = np.concatenate([self.groupMembers[self.groupStarts[group]:self.groupStarts[group + 1]]
+                                     for group in groups.tolist()] or [np.array([], dtype=np.int64)])
+        scores = np.repeat(votes, sizes)
+        keep = ~np.isin(candidates, list(self.seenRows(preferences)))
+        return candidates[keep], scores[keep]
+
+    # Same ranking as SparseRecommender.recommend (score, then post ID), but for a k it walks score levels from the
+    # top and reads at most k unseen posts from each group, instead of expanding every candidate group
+    def recommend(self, userID, k=10):
+        if userID not in self.users:
+            return "User  not found."
+        if k is None:
+            return super().recommend(userID, k)
+        preferences = self.users[userID]
+        groups, votes = self.candidateGroups(preferences)
+        seen = self.seenRows(preferences)
+        order = np.argsort(-votes, kind='stable')
+        groups, votes = groups[order], votes[order]
+        levelStarts = np.concatenate(([0], np.flatnonzero(np.diff(votes)) + 1, [len(votes)])).tolist()
+        chosen = []
+        for levelStart, levelEnd in zip(levelStarts, levelStarts[1:]):
+            need = k - len(chosen)
+            if need <= 0:
+                break
+            level = []
+            for group in groups[levelStart:levelEnd].tolist():
+                start, stop = self.groupStarts[group], self.groupStarts[group + 1]
+                members = self.groupMembers[start:min(stop, start + need + len(seen))].tolist()
+                level.extend(row for row in members if row not in seen)
+            level.sort(key=lambda row: -self.tieBreak[row])
+            chosen.extend(level[:need])
+        return self.titlesOf(np.array(chosen, dtype=np.int64))
+
+# Synthetic users and content for benchmarking; tag popularity is Zipf-like, so a few tags sit on a large share of posts
+def generateUsersAndContent(numUsers, numPosts, numTags=1000, tagsPerPost=3, likesPerUser=20, dislikesPerUser=5, seed=0):
+    rng = random.Random(seed)
+    tags = [f"tag{i}" for i in range(numTags)]
+    weights = [1 / (rank + 1) for rank in range(numTags)]
+    syntheticContent = {postID: {'title': f"Post {postID}", 'tags': list(dict.fromkeys(rng.choices(tags, weights, k=tagsPerPost)))}
+                        for postID in range(numPosts)}
+    syntheticUsers = {userID: {'liked': rng.sample(range(numPosts), likesPerUser),
+                               'disliked': rng.sample(range(numPosts), dislikesPerUser)}
+                      for userID in range(numUsers)}
+    syntheticTagIndex = defaultdict(set)
+    for postID, details in syntheticContent.items():
+        for tag in details['tags']:
+            syntheticTagIndex[tag].add(postID)
+    return syntheticUsers, syntheticContent, syntheticTagIndex
+
+# Times recommendContent (before and after profiling the users) against SparseRecommender on synthetic data,
+# and checks they all recommend the same posts
+def benchmarkRecommenders(sizes=((1000, 10000), (10000, 100000), (100000, 1000000)), queries=50, k=10):
+    print(f"{'Users':>8} {'Posts':>9} {'Build (s)':>10} {'recommendContent (s)':>21} {'Profiled (s)':>13} "
+          f"{'Sparse all (s)':>15} {'Sparse top-k (s)':>17}")
+    for numUsers, numPosts in sizes:
+        syntheticUsers, syntheticContent, syntheticTagIndex = generateUsersAndContent(numUsers, numPosts)
+        sample = random.Random(1).sample(list(syntheticUsers), queries)
+
+        startTime = time.perf_counter()
+        recommender = SparseRecommender(syntheticUsers, syntheticContent)
+        buildTime = time.perf_counter() - startTime
+
+        startTime = time.perf_counter()
+        expected = [recommendContent(userID, syntheticUsers, syntheticContent, syntheticTagIndex) for userID in sample]
+        baseTime = (time.perf_counter() - startTime) / queries
+
+        for preferences in syntheticUsers.values():
+            buildUserProfile(preferences, syntheticContent)
+        startTime = time.perf_counter()
+        profiled = [recommendContent(userID, syntheticUsers, syntheticContent, syntheticTagIndex) for userID in sample]
+        profiledTime = (time.perf_counter() - startTime) / queries
+        if any(set(titles) != set(exact) for titles, exact in zip(profiled, expected)):
+            raise AssertionError("Profiled recommendContent disagrees with the unprofiled one.")
+
+        startTime = time.perf_counter()
+        ranked = [recommender.recommend(userID, k=None) for userID in sample]
+        allTime = (time.perf_counter() - startTime) / queries
+        if any(set(titles) != set(exact) for titles, exact in zip(ranked, expected)):
+            raise AssertionError("SparseRecommender disagrees with recommendContent.")
+
+        startTime = time.perf_counter()
+        for userID in sample:
+            recommender.recommend(userID, k)
+        topTime = (time.perf_counter() - startTime) / queries
+
+        print(f"{numUsers:>8} {numPosts:>9} {buildTime:>10.3f} {baseTime:>21.6f} {profiledTime:>13.6f} {allTime:>15.6f} {topTime:>17.6f}")
+
+# Times per-user SparseRecommender.recommend calls against recommendAll, serial and on every core
+def benchmarkRecommendAll(numUsers=5000, numPosts=100000, k=10, outputPath="recommendations.jsonl"):
+    syntheticUsers, syntheticContent, _ = generateUsersAndContent(numUsers, numPosts)
+    startTime = time.perf_counter()
+    recommender = SparseRecommender(syntheticUsers, syntheticContent)
+    expected = [recommender.recommend(userID, k) for userID in syntheticUsers]
+    loopTime = time.perf_counter() - startTime
+    print(f"\nrecommendAll for {numUsers} users, {numPosts} posts (k = {k}):")
+    print(f"  one user at a time: {loopTime:.3f}s")
+    for workers in sorted({1, os.cpu_count()}):
+        startTime = time.perf_counter()
+        recommendAll(syntheticUsers, syntheticContent, k, outputPath, workers=workers)
+        print(f"  recommendAll, {workers} worker(s): {time.perf_counter() - startTime:.3f}s")
+        with open(outputPath) as inFile:
+            if [json.loads(line)['recommendations'] for line in inFile] != expected:
+                raise AssertionError("recommendAll disagrees with SparseRecommender.recommend.")
+    os.remove(outputPath)
+
+# Compares MinHashRecommender at several (bands, rows) settings with the exact top-k of SparseRecommender: query latency
+# and recall@k, where an approximate pick counts as a hit when its exact score reaches the exact k-th score
+# (so ties at the cut-off, broken by post ID in the exact ranking, do not count as misses)
+def benchmarkMinHash(numUsers=2000, numPosts=200000, settings=((4, 4), (8, 2), (16, 2), (32, 1), (64, 1)), queries=50, k=10):
+    syntheticUsers, syntheticContent, _ = generateUsersAndContent(numUsers, numPosts)
+    for preferences in syntheticUsers.values():
+        buildUserProfile(preferences, syntheticContent)
+    sample = random.Random(1).sample(list(syntheticUsers), queries)
+    exact = SparseRecommender(syntheticUsers, syntheticContent)
+    startTime = time.perf_counter()
+    for userID in sample:
+        exact.recommend(userID, k)
+    exactTime = (time.perf_counter() - startTime) / queries
+    exactScores, cutoffs = [], []
+    for userID in sample:
+        candidates, scores = exact.scoreCandidates(userID)
+        exactScores.append(dict(zip(exact.titlesOf(candidates), scores.tolist())))
+        cutoffs.append(sorted(scores.tolist(), reverse=True)[k - 1] if len(scores) >= k else 1)
+    print(f"\nMinHash/LSH on {numPosts} posts, k = {k}; exact SparseRecommender top-k: {exactTime:.6f}s per query")
+    print(f"{'Bands':>6} {'Rows':>5} {'Build (s)':>10} {'Query (s)':>10} {'Recall@k':>9}")
+    for bands, rows in settings:
+        startTime = time.perf_counter()
+        recommender = MinHashRecommender(syntheticUsers, syntheticContent, bands, rows)
+        buildTime = time.perf_counter() - startTime
+        startTime = time.perf_counter()
+        approximate = [recommender.recommend(userID, k) for userID in sample]
+        queryTime = (time.perf_counter() - startTime) / queries
+        hits = sum(scores.get(title, 0) >= cutoff
+                   for titles, scores, cutoff in zip(approximate, exactScores, cutoffs) for title in titles)
+        wanted = sum(min(k, len(scores)) for scores in exactScores)
+        print(f"{bands:>6} {rows:>5} {buildTime:>10.3f} {queryTime:>10.6f} {hits / max(1, wanted):>9.3f}")
 
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmarkRecommenders()
+        benchmarkRecommendAll()
+        benchmarkMinHash()
+        sys.exit()
+
     userID = 1
     # Get recommendations for the specified user
-    recommendedPosts = recommendContent(userID, users, content)
+    recommendedPosts = cachedRecommendContent(userID)
     print(f"Recommended posts for User {userID}: {recommendedPosts if recommendedPosts else 'No recommendations available.'}")
 
     # Simulate real-time updates - user likes posts 104 and 105
     updateUserPreferences(userID, [('like', 104), ('like', 105)])
     # Get updated recommendations after the user has liked new posts
-    recommendedPosts = recommendContent(userID, users, content)
-    print(f"Updated recommendations for User {userID}: {recommendedPosts if recommendedPosts else 'No recommendations available.'}")
\ No newline at end of file
+    recommendedPosts = cachedRecommendContent(userID)
+    print(f"Updated recommendations for User {userID}: {recommendedPosts if recommendedPosts else 'No recommendations available.'}")
+
+    # A new post sharing the user's tags invalidates their cached list
+    addContent(106, 'Post F', ['meme', 'news'])
+    recommendedPosts = cachedRecommendContent(userID)
+    print(f"Recommendations for User {userID} after Post F was added: {recommendedPosts if recommendedPosts else 'No recommendations available.'}")
+    print(f"Cache stats: {recommendationCache.stats()}")
\ No newline at end of file
@@ -1,9 +1,24 @@
+import bisect
+import hashlib
+import heapq
+import inspect
+import json
+import os
+import platform
 import random 
+import sqlite3
+import sys
 import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 import tracemalloc 
 import numpy as np
 import math
+import mmap
+import tempfile
+from array import array
+from itertools import islice
 
 # — Global Configuration
 sizes = [100, 250, 500]  # List sizes to test, can be changed for deeper examiniation, lowered from (100,500,1000) due to long waiting time
@@ -12,10 +27,30 @@ inputTypes = { #list generator is up here now! easier for access
     "Sorted": lambda size: list(range(size)),
     "Reversed": lambda size: list(range(size, 0, -1))
 }
+insertionThreshold = 12  # slices this small are finished with insertion sort by hybridSort
+keyRangeRatio = 8  # counting and radix sort are only run when the key range is at most this many times the list length
+minRunLength = 32  # hybridSort merges natural runs when they average at least this long, otherwise it uses introsort
 
 # — Sorting Algorithms 
+#Key and reverse support for the sorts below (decorate-sort-undecorate, the Schwartzian transform):
+#key is called once per item, then sortFunc sorts (key, index, item) tuples and the items are written back.
+#The unique index settles every tie, so the result is stable whatever sortFunc does and the items are never compared
+def sortDecorated(arr, sortFunc, key=None, reverse=False, low=0, high=None):
+    high = len(arr) if high is None else high
+    items = arr[low:high]
+    keys = map(key, items) if key else items
+    step = -1 if reverse else 1  # reversing ascending (key, -index) gives descending keys with ties in original order
+    decorated = [(itemKey, step * index, item) for index, (itemKey, item) in enumerate(zip(keys, items))]
+    sortFunc(decorated)
+    if reverse:
+        decorated.reverse()
+    arr[low:high] = [item for _, _, item in decorated]
+
 #Implements Bubble Sort: simple but inefficient (O(n^2) time complexity)
-def bubbleSort(arr):
+def bubbleSort(arr, key=None, reverse=False):
+    if key or reverse:
+        sortDecorated(arr, bubbleSort, key, reverse)
+        return
     n = len(arr)
     for i in range(n):
         swapped = False
@@ -26,9 +61,11 @@ def bubbleSort(arr):
         if not swapped:
             break
 
-#Implements Merge Sort: an efficient divide-and-conquer algorithm (O(n log n) time complexity)
-def mergeSort(arr):
-    if len(arr) > 1:
+#Implements Merge Sort: an efficient divide-and-conquer algorithm (O(n log n) time complexity, stable)
+def mergeSort(arr, key=None, reverse=False):
+    if key or reverse:
+        sortDecorated(arr, mergeSort, key, reverse)
+    elif len(arr) > 1:
         mid = len(arr) // 2
         left = arr[:mid]
         right = arr[mid:]
@@ -38,9 +75,9 @@ def mergeSort(arr):
 
         i = j = k = 0
 
-        #Merge the sorted halves
+        #Merge the sorted halves, taking the left item on ties so equal items keep their order
         while i < len(left) and j < len(right):
-            if left[i] < right[j]:
+            if left[i] <= right[j]:
                 arr[k] = left[i]
                 i += 1
             else:
@@ -59,11 +96,96 @@ def mergeSort(arr):
             j += 1
             k += 1
 
+#Implements Bottom-Up Merge Sort: iterative merge sort (O(n log n) time, one n-sized buffer of extra space)
+# - merges runs of width 1, 2, 4, ... back and forth between arr and a single buffer, with no recursion or slicing
+def bottomUpMergeSort(arr, key=None, reverse=False):
+    if key or reverse:
+        sortDecorated(arr, bottomUpMergeSort, key, reverse)
+        return
+    n = len(arr)
+    if n < 2:
+        return
+    width = 1
+    if math.ceil(math.log2(n)) % 2 == 1:
+        # an odd number of passes would end in the buffer, so do the width-1 pass in place and finish back in arr
+        for i in range(0, n - 1, 2):
+            if arr[i + 1] < arr[i]:
+                arr[i], arr[i + 1] = arr[i + 1], arr[i]
+        width = 2
+    source, target = arr, [None] * n
+    while width < n:
+        for low in range(0, n, 2 * width):
+            mid = min(low + width, n)
+            high = min(low + 2 * width, n)
+            i, j, k = low, mid, low
+
+            #Merge source[low:mid] and source[mid:high] into target, taking from the left on ties
+            while i < mid and j < high:
+                if source[j] < source[i]:
+                    target[k] = source[j]
+                    j += 1
+                else:
+                    target[k] = source[i]
+                    i += 1
+                k += 1
+
+            while i < mid:
+                target[k] = source[i]
+                i += 1
+                k += 1
+
+            while j < high:
+                target[k] = source[j]
+                j += 1
+                k += 1
+        source, target = target, source
+        width *= 2
+
+#Implements Counting Sort: tallies each integer key, then writes the keys back in order (O(n + k) time, O(k) space, k = key range)
+def countingSort(arr):
+    if len(arr) < 2:
+        return
+    minValue = min(arr)
+    counts = [0] * (max(arr) - minValue + 1)
+    for value in arr:
+        counts[value - minValue] += 1
+    k = 0
+    for offset, count in enumerate(counts):
+        if count:
+            arr[k:k + count] = [minValue + offset] * count
+            k += count
+
+#Implements Radix Sort: LSD radix sort on integer keys, one stable bucket pass per digit of bucketBits bits
+# (O(d * (n + 2^bucketBits)) time, where d = ceil(log2(k) / bucketBits))
+def radixSort(arr, bucketBits=8):
+    if len(arr) < 2:
+        return
+    minValue = min(arr)
+    maxKey = max(arr) - minValue
+    mask = (1 << bucketBits) - 1
+    shift = 0
+    while maxKey >> shift:
+        buckets = [[] for _ in range(1 << bucketBits)]
+        for value in arr:
+            buckets[((value - minValue) >> shift) & mask].append(value)
+        arr[:] = [value for bucket in buckets for value in bucket]
+        shift += bucketBits
+
+#Integer-key sorts only pay off when the key range is small relative to n, so the harness checks this per input
+integerKeySorts = {"Counting Sort", "Radix Sort"}
+
+def isSmallKeyRange(arr, maxRatio=keyRangeRatio):
+    if len(arr) == 0 or not all(isinstance(value, int) for value in arr):
+        return False
+    return max(arr) - min(arr) + 1 <= maxRatio * len(arr)
+
 #Implements Quick Sort: another efficient divide-and-conquer algorithm (average O(n log n), worst O(n^2))
-def quickSortInPlace(arr, low=0, high=None):
+def quickSortInPlace(arr, low=0, high=None, key=None, reverse=False):
     if high is None:
         high = len(arr) - 1
-    if low < high:
+    if key or reverse:
+        sortDecorated(arr, quickSortInPlace, key, reverse, low, high + 1)
+    elif low < high:
         pivotIndex = medianOfThreePartition(arr, low, high)
         quickSortInPlace(arr, low, pivotIndex - 1)
         quickSortInPlace(arr, pivotIndex + 1, high)
@@ -87,45 +209,419 @@ def medianOfThreePartition(arr, low, high):
     arr[i], arr[high] = arr[high], arr[i]
     return i
 
-def timeSortingAlgorithm(sortFunc, arr, inPlace=True):
+#Implements Hybrid Sort: an introsort/timsort-style engine (O(n log n) worst case, O(n) on sorted or reversed input)
+# - one pass finds natural runs, flipping strictly descending ones; a single run means the list is already sorted
+# - long runs are merged pairwise through one preallocated buffer, like timsort
+# - otherwise introsort: median-of-three quicksort, insertion sort on small slices, heapsort past the depth limit
+#   (this path is not stable: equal items can change order)
+def hybridSort(arr, key=None, reverse=False):
+    if key or reverse:
+        sortDecorated(arr, hybridSort, key, reverse)
+        return
+    n = len(arr)
+    if n <= insertionThreshold:
+        insertionSort(arr, 0, n - 1)
+        return
+    runBounds = findRuns(arr, n // minRunLength)
+    if runBounds is None:
+        introSort(arr, 0, n - 1, 2 * int(math.log2(n)))
+    elif len(runBounds) > 2:
+        mergeRuns(arr, runBounds)
+
+#Sorts arr[low..high] (inclusive) by insertion, which beats the divide-and-conquer sorts on short slices
+def insertionSort(arr, low, high):
+    for i in range(low + 1, high + 1):
+        value = arr[i]
+        j = i - 1
+        while j >= low and value < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = value
+
+#Splits arr into maximal non-descending runs, reversing strictly descending runs in place (which keeps equal items stable).
+#Returns the run boundaries [0, ..., len(arr)], or None as soon as there are more than maxRuns runs
+def findRuns(arr, maxRuns):
+    n = len(arr)
+    runBounds = [0]
+    start = 0
+    while start < n:
+        end = start + 1
+        if end < n and arr[end] < arr[start]:
+            while end < n and arr[end] < arr[end - 1]:
+                end += 1
+            arr[start:end] = arr[start:end][::-1]
+        else:
+            while end < n and not arr[end] < arr[end - 1]:
+                end += 1
+        runBounds.append(end)
+        if len(runBounds) - 1 > maxRuns:
+            return None
+        start = end
+    return runBounds
+
+#Merges adjacent runs pairwise until one remains, copying only the left run of each merge into a shared buffer
+def mergeRuns(arr, runBounds):
+    buffer = [None] * len(arr)
+    while len(runBounds) > 2:
+        mergedBounds = [0]
+        for i in range(0, len(runBounds) - 2, 2):
+            mergeWithBuffer(arr, buffer, runBounds[i], runBounds[i + 1], runBounds[i + 2])
+            mergedBounds.append(runBounds[i + 2])
+        if mergedBounds[-1] != runBounds[-1]:  # odd run out waits for the next round
+            mergedBounds.append(runBounds[-1])
+        runBounds = mergedBounds
+
+#Stable merge of the sorted runs arr[low:mid] and arr[mid:high] in place
+def mergeWithBuffer(arr, buffer, low, mid, high):
+    # items already in their final place at either end never need to move
+    low = bisect.bisect_right(arr, arr[mid], low, mid)
+    high = bisect.bisect_left(arr, arr[mid - 1], mid, high)
+    if low >= mid or mid >= high:
+        return
+    leftLength = mid - low
+    buffer[:leftLength] = arr[low:mid]
+    i, j, k = 0, mid, low
+    while i < leftLength and j < high:
+        if arr[j] < buffer[i]:
+            arr[k] = arr[j]
+            j += 1
+        else:
+            arr[k] = buffer[i]
+            i += 1
+        k += 1
+    if i < leftLength:
+        arr[k:k + leftLength - i] = buffer[i:leftLength]
+
+#Introsort on arr[low..high]: recurses into the smaller partition and loops on the larger one, so the stack stays O(log n)
+def introSort(arr, low, high, depthLimit):
+    while high - low >= insertionThreshold:
+        if depthLimit == 0:
+            heapSort(arr, low, high)
+            return
+        depthLimit -= 1
+
+        #Median of three without building and sorting a candidate list
+        mid = (low + high) // 2
+        a, b, c = arr[low], arr[mid], arr[high]
+        if a < b:
+            pivot = b if b < c else (c if a < c else a)
+        else:
+            pivot = a if a < c else (c if b < c else b)
+
+        #Hoare partition: both scans stop on items equal to the pivot, so duplicates split evenly
+        i, j = low, high
+        while i <= j:
+            while arr[i] < pivot:
+                i += 1
+            while pivot < arr[j]:
+                j -= 1
+            if i <= j:
+                arr[i], arr[j] = arr[j], arr[i]
+                i += 1
+                j -= 1
+
+        if j - low < high - i:
+            introSort(arr, low, j, depthLimit)
+            low = i
+        else:
+            introSort(arr, i, high, depthLimit)
+            high = j
+    insertionSort(arr, low, high)
+
+#Implements Heap Sort on arr[low..high]: the O(n log n) worst-case fallback once introsort recurses too deep
+def heapSort(arr, low, high):
+    size = high - low + 1
+    for root in range(size // 2 - 1, -1, -1):
+        siftDown(arr, low, root, size)
+    for end in range(size - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        siftDown(arr, low, 0, end)
+
+#Moves arr[offset + root] down the max-heap stored in arr[offset:offset + size] until its children are no larger
+def siftDown(arr, offset, root, size):
+    value = arr[offset + root]
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            break
+        if child + 1 < size and arr[offset + child] < arr[offset + child + 1]:
+            child += 1
+        if not value < arr[offset + child]:
+            break
+        arr[offset + root] = arr[offset + child]
+        root = child
+    arr[offset + root] = value
+
+# — Algorithm Table
+#Every algorithm the harness runs: name -> (function, sorts in place)
+algorithms = {
+    "Bubble Sort": (bubbleSort, True),
+    "Merge Sort": (mergeSort, True),
+    "Bottom-Up Merge Sort": (bottomUpMergeSort, True),
+    "Quick Sort": (quickSortInPlace, False),
+    "Hybrid Sort": (hybridSort, True),
+    "Counting Sort": (countingSort, True),
+    "Radix Sort": (radixSort, True)
+}
+
+# — Parallel Merge Sort
+#Workers attach to the shared-memory buffers by name and work on NumPy views of them, so no array data is pickled
+
+#Worker: sorts buffer[low:high] in place
+def sortSharedChunk(bufferName, dtype, n, low, high):
+    sharedBuffer = shared_memory.SharedMemory(name=bufferName)
+    try:
+        view = np.ndarray((n,), dtype=dtype, buffer=sharedBuffer.buf)
+        view[low:high].sort(kind="stable")
+        del view
+    finally:
+        sharedBuffer.close()
+
+#How many items of left belong among the first `outputs` items of the stable merge of left and right
+#(binary search along the merge path; left wins ties)
+def coRank(left, right, outputs):
+    low, high = max(0, outputs - len(right)), min(outputs, len(left))
+    while True:
+        i = (low + high) // 2
+        j = outputs - i
+        if i < len(left) and j > 0 and not right[j - 1] < left[i]:
+            low = i + 1
+        elif i > 0 and j < len(right) and right[j] < left[i - 1]:
+            high = i - 1
+        else:
+            return i
+
+#Worker: writes items outLow..outHigh of the stable merge of source[low:mid] and source[mid:high] into target
+def mergeSharedRuns(sourceName, targetName, dtype, n, low, mid, high, outLow, outHigh):
+    sourceBuffer = shared_memory.SharedMemory(name=sourceName)
+    targetBuffer = shared_memory.SharedMemory(name=targetName)
+    try:
+        source = np.ndarray((n,), dtype=dtype, buffer=sourceBuffer.buf)
+        target = np.ndarray((n,), dtype=dtype, buffer=targetBuffer.buf)
+        left, right = source[low:mid], source[mid:high]
+        leftStart, leftEnd = coRank(left, right, outLow - low), coRank(left, right, outHigh - low)
+        leftPart = left[leftStart:leftEnd]
+        rightPart = right[outLow - low - leftStart:outHigh - low - leftEnd]
+        out = target[outLow:outHigh]
+        #Each item lands at its index in its own run plus the number of items from the other run that precede it
+        out[np.arange(len(leftPart)) + np.searchsorted(rightPart, leftPart, side="left")] = leftPart
+        out[np.arange(len(rightPart)) + np.searchsorted(leftPart, rightPart, side="right")] = rightPart
+        del source, target, left, right, leftPart, rightPart, out
+    finally:
+        sourceBuffer.close()
+        targetBuffer.close()
+
+#Implements Parallel Merge Sort: sorts one chunk per worker process inside a shared-memory buffer, then merges runs
+#pairwise in rounds, splitting every round's output evenly across the workers (O(n log n / p) work per core).
+#Sorts a NumPy array (or a list) in place
+def parallelMergeSort(arr, workers=None):
+    workers = workers or os.cpu_count()
+    values = np.asarray(arr)
+    n = len(values)
+    if n < 2:
+        return
+    dtype = values.dtype.str
+    buffers = [shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1)) for _ in range(2)]
+    try:
+        source = np.ndarray((n,), dtype=dtype, buffer=buffers[0].buf)
+        source[:] = values
+        bounds = [round(n * i / workers) for i in range(workers + 1)]
+        runs = [(bounds[i], bounds[i + 1]) for i in range(workers) if bounds[i] < bounds[i + 1]]
+
+        if workers == 1:
+            sortSharedChunk(buffers[0].name, dtype, n, 0, n)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(sortSharedChunk, *zip(*[(buffers[0].name, dtype, n, low, high) for low, high in runs])))
+                sourceIndex = 0
+                while len(runs) > 1:
+                    merges = [(runs[i][0], runs[i][1], runs[i + 1][1] if i + 1 < len(runs) else runs[i][1])
+                              for i in range(0, len(runs), 2)]
+                    tasks = []
+                    for low, mid, high in merges:
+                        pieces = max(1, round(workers * (high - low) / n))
+                        for piece in range(pieces):
+                            outLow = low + (high - low) * piece // pieces
+                            outHigh = low + (high - low) * (piece + 1) // pieces
+                            tasks.append((buffers[sourceIndex].name, buffers[1 - sourceIndex].name, dtype, n,
+                                          low, mid, high, outLow, outHigh))
+                    list(pool.map(mergeSharedRuns, *zip(*tasks)))
+                    runs = [(low, high) for low, _, high in merges]
+                    sourceIndex = 1 - sourceIndex
+                source = np.ndarray((n,), dtype=dtype, buffer=buffers[sourceIndex].buf)
+        arr[:] = source if isinstance(arr, np.ndarray) else source.tolist()
+        del source
+    finally:
+        for sharedBuffer in buffers:
+            sharedBuffer.close()
+            sharedBuffer.unlink()
+
+#Times parallelMergeSort with 1, 2, 4, ... worker processes and reports the speedup over one worker
+def reportParallelSpeedup(sizeList=(10**6, 10**7), coreCounts=None):
+    coreCounts = coreCounts or [2**i for i in range(int(math.log2(os.cpu_count())) + 1)]
+    print("\nParallel Merge Sort Speedup:")
+    for size in sizeList:
+        arr = np.random.randint(0, 10001, size)
+        baseline = None
+        for cores in coreCounts:
+            arrCopy = arr.copy()
+            startTime = time.perf_counter()
+            parallelMergeSort(arrCopy, cores)
+            elapsed = time.perf_counter() - startTime
+            baseline = baseline or elapsed
+            print(f"  n = {size}, {cores} core(s): {elapsed:.3f}s (speedup {baseline / elapsed:.2f}x)")
+
+# — NumPy Backend
+#Array versions of the input generators, so sizes of 10^6-10^8 are built in C instead of one Python int at a time
+numpySizes = [10**6, 10**7]  # 10**8 also works with ~3 GB of free memory
+numpyInputTypes = {
+    "Random": lambda size: np.random.randint(0, 10001, size),
+    "Sorted": lambda size: np.arange(size),
+    "Reversed": lambda size: np.arange(size, 0, -1)
+}
+
+#NumPy's built-in sorts, run in place on an ndarray
+def numpyQuickSort(arr):
+    arr.sort(kind="quicksort")  # introsort in NumPy
+
+def numpyMergeSort(arr):
+    arr.sort(kind="stable")  # timsort or radix sort, depending on dtype
+
+def numpyHeapSort(arr):
+    arr.sort(kind="heapsort")
+
+#Implements NumPy Radix Sort: vectorized LSD radix sort for bounded integers (O(d * (n + 2^b)), d digits of b bits)
+# - when the whole key range fits in one digit (like 0-10000) this is a single counting pass: bincount + repeat
+# - wider keys take one stable pass per digit; NumPy counting-sorts 8- and 16-bit digit arrays internally
+def numpyRadixSort(arr, digitBits=None):
+    if arr.size < 2:
+        return
+    minValue = arr.min()
+    keys = (arr - minValue).astype(np.uint64)  # shift so negative keys work too
+    maxKey = int(keys.max())
+    if digitBits is None:
+        digitBits = max(maxKey.bit_length(), 1) if maxKey < 2**24 else 16
+    if maxKey < 2**min(digitBits, 24):  # the count array stays at most 2^24 entries, wider digits take argsort passes
+        counts = np.bincount(keys, minlength=maxKey + 1)
+        arr[:] = np.repeat(np.arange(minValue, minValue + maxKey + 1, dtype=arr.dtype), counts)
+        return
+    # the narrowest unsigned type that holds a whole digit (NumPy counting-sorts 8- and 16-bit ones)
+    digitType = next(dtype for dtype in (np.uint8, np.uint16, np.uint32, np.uint64) if digitBits <= np.iinfo(dtype).bits)
+    mask = np.uint64((1 << digitBits) - 1)
+    shift = 0
+    while maxKey >> shift:
+        digits = ((keys >> np.uint64(shift)) & mask).astype(digitType)
+        keys = keys[np.argsort(digits, kind="stable")]
+        shift += digitBits
+    arr[:] = keys.astype(arr.dtype) + minValue
+
+numpyAlgorithms = {
+    "NumPy Quick Sort": (numpyQuickSort, True),
+    "NumPy Merge Sort": (numpyMergeSort, True),
+    "NumPy Heap Sort": (numpyHeapSort, True),
+    "NumPy Radix Sort": (numpyRadixSort, True),
+    "Parallel Merge Sort": (parallelMergeSort, True)
+}
+
+#Backend name -> (algorithm table, input generators), so worker processes can look tables up by name
+backends = {
+    "python": (algorithms, inputTypes),
+    "numpy": (numpyAlgorithms, numpyInputTypes)
+}
+
+# — Measurement Engine
+#tracemalloc hooks every allocation, which slows allocation-heavy sorts (like mergeSort) far more than in-place ones,
+#so time is measured in an untraced pass and peak memory in a separate traced pass
+
+#Times one sort of a fresh copy of arr in nanoseconds, with no tracing active
+def timeSortOnce(sortFunc, arr, inPlace=True):
+    arrCopy = arr.copy()
+    startTime = time.perf_counter_ns()
+    if inPlace:
+        sortFunc(arrCopy)
+    else:
+        arrCopy = sortFunc(arrCopy)
+    return time.perf_counter_ns() - startTime
+
+#Runs one sort under tracemalloc and returns (peak bytes, traced nanoseconds)
+def measurePeakMemory(sortFunc, arr, inPlace=True):
     arrCopy = arr.copy()
     tracemalloc.start()
-    startTime = time.time()
+    startTime = time.perf_counter_ns()
     if inPlace:
         sortFunc(arrCopy)
     else:
         arrCopy = sortFunc(arrCopy)
-    endTime = time.time()
+    tracedTime = time.perf_counter_ns() - startTime
     _, peak = tracemalloc.get_traced_memory()
     tracemalloc.stop()
-    return endTime - startTime, peak
+    return peak, tracedTime
 
-def compareSortsWithSpace():
-    algorithms = {
-        "Bubble Sort": (bubbleSort, True),
-        "Merge Sort": (mergeSort, True),
-        "Quick Sort": (quickSortInPlace, False)
-    }
+#Warms up, then repeats the untraced timing until the median moves by less than tolerance (or maxRepeats is hit).
+#Returns the median in nanoseconds and the raw samples
+def measureStableTime(sortFunc, arr, inPlace=True, warmups=1, minRepeats=5, maxRepeats=50, tolerance=0.02):
+    for _ in range(warmups):
+        timeSortOnce(sortFunc, arr, inPlace)
+    samples = []
+    while len(samples) < maxRepeats:
+        samples.append(timeSortOnce(sortFunc, arr, inPlace))
+        if len(samples) >= minRepeats:
+            current, previous = np.median(samples), np.median(samples[:-1])
+            if abs(current - previous) <= tolerance * current:
+                break
+    return float(np.median(samples)), samples
+
+#One harness sample: a clean timing pass, then a separate memory pass. Returns (seconds, peak bytes) as before
+def timeSortingAlgorithm(sortFunc, arr, inPlace=True):
+    elapsed = timeSortOnce(sortFunc, arr, inPlace)
+    peak, _ = measurePeakMemory(sortFunc, arr, inPlace)
+    return elapsed / 1e9, peak
+
+#Reports the stable untraced time, the peak memory, and how much the old traced timing overstated each algorithm
+def reportMeasurementOverhead(algorithmTable=None, inputTable=None, sizeList=None):
+    algorithmTable = algorithms if algorithmTable is None else algorithmTable
+    inputTable = inputTypes if inputTable is None else inputTable
+    sizeList = sizes if sizeList is None else sizeList
+    print("\nTiming vs. Tracing Overhead:")
+    print(f"  {'Algorithm':<22}{'Input':<10}{'Size':>8}{'Clean (s)':>12}{'Traced (s)':>12}{'Overhead':>10}{'Peak (B)':>10}")
+    for size in sizeList:
+        for inputName, generator in inputTable.items():
+            arr = generator(size)
+            for algoName, (algoFunc, inPlace) in algorithmTable.items():
+                if algoName in integerKeySorts and not isSmallKeyRange(arr):
+                    continue
+                cleanTime, _ = measureStableTime(algoFunc, arr, inPlace)
+                peak, tracedTime = measurePeakMemory(algoFunc, arr, inPlace)
+                overhead = (tracedTime - cleanTime) / cleanTime * 100
+                print(f"  {algoName:<22}{inputName:<10}{size:>8}{cleanTime / 1e9:>12.6f}{tracedTime / 1e9:>12.6f}{overhead:>9.0f}%{peak:>10}")
 
+#Runs every algorithm once on every input type and size (defaults to the global tables, or pass the NumPy ones)
+def compareSortsWithSpace(algorithmTable=None, inputTable=None, sizeList=None):
+    algorithmTable = algorithms if algorithmTable is None else algorithmTable
+    inputTable = inputTypes if inputTable is None else inputTable
+    sizeList = sizes if sizeList is None else sizeList
     results = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
     space_results = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
 
-    for size in sizes:
-        for inputName, generator in inputTypes.items():
+    for size in sizeList:
+        for inputName, generator in inputTable.items():
             arr = generator(size)
-            for algoName, (algoFunc, inPlace) in algorithms.items():
+            smallKeyRange = isSmallKeyRange(arr)
+            for algoName, (algoFunc, inPlace) in algorithmTable.items():
+                if algoName in integerKeySorts and not smallKeyRange:
+                    continue
                 elapsed, peak = timeSortingAlgorithm(algoFunc, arr, inPlace)
                 results[algoName][inputName][size].append(elapsed)
                 space_results[algoName][inputName][size].append(peak)
 
     return results, space_results
 
-def collectRunsWithSpace(numRuns=50): #lowered run count as it was a lot for my laptop to load
+def collectRunsWithSpace(numRuns=50, algorithmTable=None, inputTable=None, sizeList=None): #lowered run count as it was a lot for my laptop to load
     overallTime = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
     overallSpace = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
 
     for _ in range(numRuns):
-        runTime, runSpace = compareSortsWithSpace()
+        runTime, runSpace = compareSortsWithSpace(algorithmTable, inputTable, sizeList)
         for algoName, inputData in runTime.items():
             for inputName, sizeData in inputData.items():
                 for size, times in sizeData.items():
@@ -134,6 +630,301 @@ def collectRunsWithSpace(numRuns=50): #lowered run count as it was a lot for my
 
     return overallTime, overallSpace
 
+# — Parallel Runner
+#Derives the RNG seed for one (input, size, run) slot, so every algorithm in that slot sorts the same list
+#no matter which worker process runs it or in what order
+def cellSeed(baseSeed, inputName, size, run):
+    digest = hashlib.sha256(f"{baseSeed}:{inputName}:{size}:{run}".encode()).digest()
+    return int.from_bytes(digest[:4], "little")
+
+#Worker: regenerates the seeded input for one cell and times one algorithm on it (None if the algorithm doesn't apply)
+def runBenchmarkCell(backend, algoName, inputName, size, run, baseSeed):
+    algorithmTable, inputTable = backends[backend]
+    seed = cellSeed(baseSeed, inputName, size, run)
+    random.seed(seed)
+    np.random.seed(seed)
+    arr = inputTable[inputName](size)
+    if algoName in integerKeySorts and not isSmallKeyRange(arr):
+        return None
+    algoFunc, inPlace = algorithmTable[algoName]
+    return timeSortingAlgorithm(algoFunc, arr, inPlace)
+
+#Same results layout as collectRunsWithSpace, but every (algorithm, input, size, run) cell is an independent task
+#spread across a process pool; per-cell seeds make the inputs reproducible for a given baseSeed
+def collectRunsParallel(numRuns=50, workers=None, baseSeed=0, backend="python", sizeList=None):
+    algorithmTable, inputTable = backends[backend]
+    sizeList = (sizes if backend == "python" else numpySizes) if sizeList is None else sizeList
+    workers = workers or os.cpu_count()
+    cells = [(backend, algoName, inputName, size, run, baseSeed)
+             for run in range(numRuns) for size in sizeList for inputName in inputTable for algoName in algorithmTable]
+
+    overallTime = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+    overallSpace = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunkSize = max(1, len(cells) // (workers * 8))  # big enough to amortize IPC, small enough to balance slow cells
+        for cell, result in zip(cells, pool.map(runBenchmarkCell, *zip(*cells), chunksize=chunkSize)):
+            if result is None:
+                continue
+            _, algoName, inputName, size, _, _ = cell
+            elapsed, peak = result
+            overallTime[algoName][inputName][size].append(elapsed)
+            overallSpace[algoName][inputName][size].append(peak)
+
+    return overallTime, overallSpace
+
+# — Persistent Result Store
+resultStorePath = "benchmark_results.sqlite"
+
+#Module-level values of these types are folded into algorithmHash by repr; anything else (modules, classes, tables of
+#functions) has no stable repr and is left out
+hashedValueTypes = (int, float, complex, str, bytes, bool, tuple, frozenset, type(None))
+
+#Global names a function reads, including those read by the lambdas and comprehensions nested in it
+def referencedNames(code):
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if inspect.iscode(constant):
+            names |= referencedNames(constant)
+    return names
+
+#Fingerprints an algorithm by its source plus the source of every module-level function it calls and the repr of
+#every module-level constant they read (so editing a helper like introSort, or insertionThreshold, invalidates
+#hybridSort's stored results too). When inputGenerator is given, its source and dependencies are included as well,
+#since samples are only comparable if the inputs were generated the same way
+def algorithmHash(func, inputGenerator=None):
+    sources = {}
+    pending = [func] if inputGenerator is None else [func, inputGenerator]
+    while pending:
+        current = pending.pop()
+        key = f"{current.__qualname__}:{current.__code__.co_firstlineno}"  # lambdas all share the name <lambda>
+        if key in sources:
+            continue
+        sources[key] = inspect.getsource(current)
+        for name in sorted(referencedNames(current.__code__)):
+            if name not in globals():
+                continue
+            dependency = globals()[name]
+            if inspect.isfunction(dependency) and dependency.__module__ == func.__module__:
+                pending.append(dependency)
+            elif isinstance(dependency, hashedValueTypes):
+                sources[name] = f"{name} = {dependency!r}\n"
+    return hashlib.sha256("".join(sources[key] for key in sorted(sources)).encode()).hexdigest()[:16]
+
+#The Class ResultStore
+# - SQLite cache of single benchmark samples keyed by (algorithm and input generator source hash, input type, size, seed, Python version);
+#   a sample with no time means the algorithm didn't apply to that input (e.g. counting sort on a wide key range)
+class ResultStore:
+    def __init__(self, path=resultStorePath):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS samples (
+                algoHash TEXT, algoName TEXT, inputType TEXT, size INTEGER, seed INTEGER, pythonVersion TEXT,
+                elapsed REAL, peak INTEGER,
+                PRIMARY KEY (algoHash, inputType, size, seed, pythonVersion)
+            )""")
+        self.pythonVersion = platform.python_version()
+    def close(self):
+        self.connection.close()
+    def storedSeeds(self, algoHash, inputName, size): # seeds already measured for one cell under this Python version.
+        rows = self.connection.execute(
+            "SELECT seed FROM samples WHERE algoHash = ? AND inputType = ? AND size = ? AND pythonVersion = ?",
+            (algoHash, inputName, size, self.pythonVersion))
+        return {seed for (seed,) in rows}
+    def record(self, samples): # saves (algoHash, algoName, inputName, size, seed, result) tuples; result may be None.
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO samples VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(algoHash, algoName, inputName, size, seed, self.pythonVersion,
+                  None if result is None else result[0], None if result is None else result[1])
+                 for algoHash, algoName, inputName, size, seed, result in samples])
+    def load(self, algorithmTable, inputTable, sizeList, seedsFor): # nested timeData/spaceData for the current algorithm and input versions.
+        overallTime = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+        overallSpace = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+        for algoName, (algoFunc, _) in algorithmTable.items():
+            for inputName, inputGenerator in inputTable.items():
+                algoHash = algorithmHash(algoFunc, inputGenerator)
+                for size in sizeList:
+                    wanted = seedsFor(inputName, size)
+                    rows = self.connection.execute(
+                        "SELECT seed, elapsed, peak FROM samples WHERE algoHash = ? AND inputType = ? AND size = ? "
+                        "AND pythonVersion = ? AND elapsed IS NOT NULL ORDER BY seed",
+                        (algoHash, inputName, size, self.pythonVersion))
+                    for seed, elapsed, peak in rows:
+                        if seed in wanted:
+                            overallTime[algoName][inputName][size].append(elapsed)
+                            overallSpace[algoName][inputName][size].append(peak)
+        return overallTime, overallSpace
+
+#Like collectRunsParallel, but only measures the (algorithm, input, size, seed) samples the store doesn't have yet,
+#then returns every requested sample from the store; repeat analyses with unchanged algorithms measure nothing
+def collectRunsCached(store=None, numRuns=50, baseSeed=0, backend="python", sizeList=None, workers=1):
+    store = ResultStore() if store is None else store
+    algorithmTable, inputTable = backends[backend]
+    sizeList = (sizes if backend == "python" else numpySizes) if sizeList is None else sizeList
+    seedsFor = lambda inputName, size: {cellSeed(baseSeed, inputName, size, run) for run in range(numRuns)}
+
+    missing = []
+    for algoName, (algoFunc, _) in algorithmTable.items():
+        for inputName in inputTable:
+            algoHash = algorithmHash(algoFunc, inputTable[inputName])
+            for size in sizeList:
+                stored = store.storedSeeds(algoHash, inputName, size)
+                for run in range(numRuns):
+                    if cellSeed(baseSeed, inputName, size, run) not in stored:
+                        missing.append((algoHash, algoName, inputName, size, run))
+
+    if missing:
+        print(f"Measuring {len(missing)} missing samples...")
+        cells = [(backend, algoName, inputName, size, run, baseSeed) for _, algoName, inputName, size, run in missing]
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                measured = list(pool.map(runBenchmarkCell, *zip(*cells), chunksize=max(1, len(cells) // (workers * 8))))
+        else:
+            measured = [runBenchmarkCell(*cell) for cell in cells]
+        store.record([(algoHash, algoName, inputName, size, cellSeed(baseSeed, inputName, size, run), result)
+                      for (algoHash, algoName, inputName, size, run), result in zip(missing, measured)])
+
+    return store.load(algorithmTable, inputTable, sizeList, seedsFor)
+
+# — Complexity Model Fitting
+#Candidate growth models: name -> f(n, k); each is fitted as time ≈ a * f(n, k) + b, where b absorbs constant overhead
+complexityModels = {
+    "O(n)": lambda n, k: n,
+    "O(n log n)": lambda n, k: n * np.log2(n),
+    "O(n²)": lambda n, k: n ** 2,
+    "O(n + k)": lambda n, k: n + k
+}
+
+#"O(n + k)" can only be told apart from "O(n)" when k does not move with n: a constant k is absorbed by the
+#intercept and k proportional to n just doubles the slope. True when k is not (within tolerance) a + b*n
+def keyRangeVariesSeparately(n, k, tolerance=0.05):
+    design = np.column_stack((n, np.ones_like(n)))
+    coefficients, *_ = np.linalg.lstsq(design, k, rcond=None)
+    return np.linalg.norm(design @ coefficients - k) > tolerance * np.linalg.norm(k)
+
+#Exponents tried for the free power-law model time ≈ a * n^p + b
+powerLawExponents = np.linspace(0.5, 3.0, 251)
+poorFitError = 0.10  # weighted RMS relative error above which even the best model is flagged as a poor description
+
+#Weighted least squares fit of time ≈ slope * growth + overhead. Returns (slope, overhead, weighted residual)
+def fitGrowth(growth, y, weights):
+    design = np.column_stack((growth, np.ones_like(growth)))
+    (slope, overhead), *_ = np.linalg.lstsq(design * weights[:, None], y * weights, rcond=None)
+    return slope, overhead, np.sum(((design @ (slope, overhead) - y) * weights) ** 2)
+
+#Fits every candidate model by least squares, weighted by 1/time so small sizes count as much as large ones,
+#and ranks them by BIC (AIC also reported). "O(n + k)" is only tried when the key range of each size is given
+#and varies separately from n. A power law with a free exponent (chosen from powerLawExponents, counted as a third
+#parameter) is fitted too, so growth like n^1.3 isn't forced onto the nearest fixed model. Each fit's "error" is its
+#weighted RMS relative error
+def fitComplexityModels(sizeList, times, keyRanges=None):
+    n = np.asarray(sizeList, dtype=float)
+    y = np.asarray(times, dtype=float)
+    k = np.zeros_like(n) if keyRanges is None else np.asarray(keyRanges, dtype=float)
+    weights = 1 / np.maximum(y, 1e-12)
+    samples = len(n)
+    fitKeyRange = keyRanges is not None and keyRangeVariesSeparately(n, k)
+    candidates = []
+    for modelName, model in complexityModels.items():
+        if modelName == "O(n + k)" and not fitKeyRange:
+            continue
+        candidates.append(({"model": modelName}, 2, fitGrowth(model(n, k), y, weights)))
+    powerLaws = [(exponent, fitGrowth(n ** exponent, y, weights)) for exponent in powerLawExponents]
+    powerLaws = [(exponent, fit) for exponent, fit in powerLaws if fit[0] > 0]
+    if powerLaws and samples > 3:
+        exponent, fit = min(powerLaws, key=lambda powerLaw: powerLaw[1][2])
+        candidates.append(({"model": f"O(n^{exponent:.2f})", "exponent": exponent}, 3, fit))
+    fits = []
+    for fit, parameters, (slope, overhead, residual) in candidates:
+        if slope <= 0:  # a model that needs time to shrink with n doesn't describe the data
+            continue
+        logLikelihoodTerm = samples * math.log(max(residual, 1e-300) / samples)
+        fit.update({
+            "slope": slope, "overhead": overhead, "error": math.sqrt(residual / samples),
+            "aic": logLikelihoodTerm + 2 * parameters, "bic": logLikelihoodTerm + parameters * math.log(samples)
+        })
+        fits.append(fit)
+    return sorted(fits, key=lambda fit: fit["bic"])
+
+#Predicted time of a fitted model at size n (keyRange used by "O(n + k)")
+def predictTime(fit, n, keyRange=0):
+    growth = n ** fit["exponent"] if "exponent" in fit else complexityModels[fit["model"]](n, keyRange)
+    return fit["slope"] * growth + fit["overhead"]
+
+#Times one algorithm on sizes startSize, startSize*growth, ... up to maxSize, stopping before a size whose
+#predicted time (extrapolated from the last two sizes) would exceed timeBudget seconds.
+#Returns (sizes, median times, key ranges)
+def sweepSizes(algoName, inputName, maxSize=10**6, startSize=100, growth=2, timeBudget=1.0, repeats=3, backend="python", baseSeed=0):
+    algorithmTable, inputTable = backends[backend]
+    algoFunc, inPlace = algorithmTable[algoName]
+    sweptSizes, medianTimes, keyRanges = [], [], []
+    size = startSize
+    while size <= maxSize:
+        seed = cellSeed(baseSeed, inputName, size, 0)
+        random.seed(seed)
+        np.random.seed(seed)
+        arr = inputTable[inputName](size)
+        if algoName in integerKeySorts and not isSmallKeyRange(arr):
+            size *= growth
+            continue
+        medianTime = float(np.median([timeSortOnce(algoFunc, arr, inPlace) for _ in range(repeats)])) / 1e9
+        sweptSizes.append(size)
+        medianTimes.append(medianTime)
+        keyRanges.append(int(max(arr) - min(arr) + 1))
+        if len(medianTimes) >= 2 and medianTimes[-2] > 0:
+            exponent = max(math.log(max(medianTimes[-1], 1e-12) / medianTimes[-2]) / math.log(growth), 1)
+        else:
+            exponent = 2  # assume the worst until there are two points
+        if medianTime * growth ** exponent * repeats > timeBudget:
+            break
+        size *= growth
+    return sweptSizes, medianTimes, keyRanges
+
+#Sizes (on a geometric grid up to maxSize) where two fitted algorithms swap places as the faster one
+def findCrossovers(bestFits, keyRangeAt, maxSize=10**6, minSize=10):
+    grid = np.geomspace(minSize, maxSize, 400)
+    predictions = {algoName: np.array([predictTime(fit, n, keyRangeAt(n)) for n in grid]) for algoName, fit in bestFits.items()}
+    crossovers = []
+    names = list(predictions)
+    for i, first in enumerate(names):
+        for second in names[i + 1:]:
+            difference = predictions[first] - predictions[second]
+            for j in np.nonzero(np.diff(np.sign(difference)))[0]:
+                faster = first if difference[j + 1] < 0 else second
+                crossovers.append((int(grid[j + 1]), first, second, faster))
+    return sorted(crossovers)
+
+#Sweeps every algorithm on one input type, prints the best-fitting model for each (with AIC/BIC of all candidates),
+#then the sizes where one algorithm overtakes another
+def analyzeComplexityScaling(inputName="Random", algorithmTable=None, maxSize=10**6, timeBudget=1.0):
+    algorithmTable = algorithms if algorithmTable is None else algorithmTable
+    backend = "numpy" if algorithmTable is numpyAlgorithms else "python"
+    print(f"\nComplexity Model Fitting ({inputName} input, sizes up to {maxSize}, {timeBudget}s budget per size):")
+    bestFits = {}
+    keyRangeSamples = {}
+    smallestSize = maxSize
+    for algoName in algorithmTable:
+        sweptSizes, medianTimes, keyRanges = sweepSizes(algoName, inputName, maxSize, timeBudget=timeBudget, backend=backend)
+        if len(sweptSizes) < 3:
+            print(f"\n→ {algoName}: only {len(sweptSizes)} feasible sizes, skipping the fit")
+            continue
+        keyRangeSamples.update(zip(sweptSizes, keyRanges))
+        smallestSize = min(smallestSize, sweptSizes[0])
+        fits = fitComplexityModels(sweptSizes, medianTimes, keyRanges)
+        bestFits[algoName] = fits[0]
+        print(f"\n→ {algoName}: best fit {fits[0]['model']} over n = {sweptSizes[0]}..{sweptSizes[-1]}")
+        if fits[0]["error"] > poorFitError:
+            print(f"    warning: poor fit, predictions are off by {fits[0]['error']:.0%} on average")
+        for fit in fits:
+            print(f"    {fit['model']:<12} time ≈ {fit['slope']:.3e}·f(n) + {fit['overhead']:.2e}s   "
+                  f"error {fit['error']:6.1%}   AIC {fit['aic']:8.1f}   BIC {fit['bic']:8.1f}")
+
+    knownSizes = sorted(keyRangeSamples)
+    keyRangeAt = lambda n: float(np.interp(n, knownSizes, [keyRangeSamples[size] for size in knownSizes])) if knownSizes else 0.0
+    print("\nCrossover Sizes:")
+    for size, first, second, faster in findCrossovers(bestFits, keyRangeAt, maxSize, smallestSize):
+        print(f"  around n = {size}: {first} vs {second} -> {faster} is faster above this size")
+
 def analyzeComplexityTrends(timeData, spaceData):
     print("\nEmpirical Complexity Analysis:")
     def fitTrend(xVals, yVals):
@@ -166,6 +957,9 @@ def analyzeComplexityTrends(timeData, spaceData):
                 avgSpaces.append(np.mean(spaceData[algoName][inputName][size]))
 
             print(f"  Input Type: {inputName}")
+            if len(sizesList) < 2:
+                print("    Not enough sizes measured to fit a trend.")
+                continue
             timeTrends = fitTrend(sizesList, avgTimes)
             spaceTrends = fitTrend(sizesList, avgSpaces)
 
@@ -185,6 +979,12 @@ def analyzeComplexityTrends(timeData, spaceData):
 
             print(f"    Estimated Time Complexity: {timeComplexity} (slope: {loglogSlopeTime:.2f})")
             print(f"    Estimated Space Complexity: {spaceComplexity} (slope: {loglogSlopeSpace:.2f})")
+            if len(sizesList) >= 3:
+                print(f"    Best-Fit Time Model (BIC): {fitComplexityModels(sizesList, avgTimes)[0]['model']}")
+            if algoName in integerKeySorts:
+                #These only run when k <= keyRangeRatio * n, so O(n + k) should show up as a linear slope
+                verdict = "consistent with" if loglogSlopeTime < 1.2 else "NOT consistent with"
+                print(f"    Expected O(n + k) with k <= {keyRangeRatio}n: measured time is {verdict} it")
 
 def rankAlgorithmsByTime(timeData):
     print("\nAverage Timings Across Runs:")
@@ -206,8 +1006,10 @@ def rankAlgorithmsByTime(timeData):
     summary_messages = []
     bestAlgoCount = defaultdict(int)
 
-    for inputType in inputTypes:
-        for size in sizes:
+    measuredInputs = list(dict.fromkeys(inputName for inputData in averageResults.values() for inputName in inputData))
+    measuredSizes = sorted({size for inputData in averageResults.values() for sizeData in inputData.values() for size in sizeData})
+    for inputType in measuredInputs:
+        for size in measuredSizes:
             bestAlgo = None
             bestTime = float('inf')
             for algoName in averageResults:
@@ -226,8 +1028,7 @@ def rankAlgorithmsByTime(timeData):
 
     print("\nRanking of Sorting Algorithms by Number of Wins:")
 
-    allAlgorithms = ["Bubble Sort", "Merge Sort", "Quick Sort"]
-    for algo in allAlgorithms:
+    for algo in averageResults:
         if algo not in bestAlgoCount:
             bestAlgoCount[algo] = 0
 
@@ -235,9 +1036,381 @@ def rankAlgorithmsByTime(timeData):
     for rank, (algo, count) in enumerate(sortedRanking, 1):
         print(f"{rank}. {algo} - {count} wins")
 
+# — Benchmark Statistics
+#The Class BenchmarkResults
+# - keeps the raw timing samples of every (algorithm, input, size) cell as a NumPy array and summarizes them with
+#   robust statistics: Tukey-fence outlier rejection, median, IQR and a bootstrap confidence interval for the median
+class BenchmarkResults:
+    def __init__(self, timeData=None, confidence=0.95, bootstrapRounds=2000, seed=0):
+        self.samples = {}
+        self.confidence = confidence
+        self.bootstrapRounds = bootstrapRounds
+        self.rng = np.random.default_rng(seed)
+        self.intervals = {}  # key -> bootstrap interval, computed once per set of samples so every caller sees the same one
+        if timeData is not None:
+            self.addTimeData(timeData)
+    def add(self, algoName, inputName, size, values): # appends raw samples to one cell.
+        key = (algoName, inputName, size)
+        newValues = np.asarray(values, dtype=float)
+        self.samples[key] = np.concatenate((self.samples[key], newValues)) if key in self.samples else newValues
+        self.intervals.pop(key, None)
+    def addTimeData(self, timeData): # loads the nested timeData[algo][input][size] lists the harness produces.
+        for algoName, inputData in timeData.items():
+            for inputName, sizeData in inputData.items():
+                for size, times in sizeData.items():
+                    self.add(algoName, inputName, size, times)
+    def cells(self, inputName=None, size=None): # keys of every stored cell, optionally filtered by input type and size.
+        return [key for key in self.samples if (inputName is None or key[1] == inputName) and (size is None or key[2] == size)]
+    def cleaned(self, key): # samples with outliers beyond 1.5 IQR of the quartiles removed.
+        values = self.samples[key]
+        if len(values) < 4:
+            return values
+        q1, q3 = np.percentile(values, [25, 75])
+        fence = 1.5 * (q3 - q1)
+        return values[(values >= q1 - fence) & (values <= q3 + fence)]
+    def median(self, key):
+        return float(np.median(self.cleaned(key)))
+    def iqr(self, key):
+        q1, q3 = np.percentile(self.cleaned(key), [25, 75])
+        return float(q3 - q1)
+    def confidenceInterval(self, key): # percentile bootstrap interval for the median of the cleaned samples (cached until the cell changes).
+        if key in self.intervals:
+            return self.intervals[key]
+        values = self.cleaned(key)
+        if len(values) < 2:
+            interval = float(values[0]), float(values[0])
+        else:
+            resampled = self.rng.choice(values, size=(self.bootstrapRounds, len(values)), replace=True)
+            medians = np.median(resampled, axis=1)
+            tail = (1 - self.confidence) / 2 * 100
+            low, high = np.percentile(medians, [tail, 100 - tail])
+            interval = float(low), float(high)
+        self.intervals[key] = interval
+        return interval
+    def relativeError(self, key): # half-width of the confidence interval relative to the median.
+        low, high = self.confidenceInterval(key)
+        median = self.median(key)
+        return (high - low) / 2 / median if median > 0 else float("inf")
+    def isConverged(self, key, targetRelativeError=0.05): # True once more runs would barely tighten the estimate.
+        return len(self.samples.get(key, ())) >= 3 and self.relativeError(key) <= targetRelativeError
+    def bestAlgorithm(self, inputName, size): # (winner, contenders): winner is None unless its interval clears every other one.
+        keys = sorted(self.cells(inputName, size), key=self.median)
+        if not keys:
+            return None, []
+        intervals = {key: self.confidenceInterval(key) for key in keys}
+        fastest = keys[0]
+        contenders = [key[0] for key in keys if intervals[key][0] <= intervals[fastest][1]]
+        return (fastest[0] if len(contenders) == 1 else None), contenders
+
+#Ranks algorithms by median time, only counting a win when the fastest algorithm's confidence interval
+#doesn't overlap any other algorithm's interval; overlapping cells are reported as ties
+def rankAlgorithmsWithConfidence(timeData, confidence=0.95):
+    results = BenchmarkResults(timeData, confidence)
+    print(f"\nMedian Timings with {confidence:.0%} Bootstrap Confidence Intervals (outliers removed):")
+    for key in results.samples:
+        algoName, inputName, size = key
+        low, high = results.confidenceInterval(key)
+        print(f"  {algoName} / {inputName} / {size}: median {results.median(key):.6f}s, "
+              f"IQR {results.iqr(key):.6f}s, CI [{low:.6f}, {high:.6f}]")
+
+    print("\nStatistically Significant Winners by Input Type and Size:")
+    winCount = {algoName: 0 for algoName, _, _ in results.samples}
+    measuredInputs = list(dict.fromkeys(inputName for _, inputName, _ in results.samples))
+    measuredSizes = sorted({size for _, _, size in results.samples})
+    for inputName in measuredInputs:
+        for size in measuredSizes:
+            winner, contenders = results.bestAlgorithm(inputName, size)
+            if winner:
+                winCount[winner] += 1
+                print(f"For {inputName} lists of size {size}, the fastest algorithm is: {winner}")
+            elif contenders:
+                print(f"For {inputName} lists of size {size}, no clear winner (overlapping intervals): {', '.join(contenders)}")
+
+    print("\nRanking of Sorting Algorithms by Significant Wins:")
+    for rank, (algo, count) in enumerate(sorted(winCount.items(), key=lambda x: x[1], reverse=True), 1):
+        print(f"{rank}. {algo} - {count} wins")
+    return results
+
+# — Adaptive Run Scheduler
+#Like collectRunsWithSpace, but each (algorithm, input, size) cell stops on its own once its median's confidence
+#interval is within targetRelativeError (after at least minRuns, at most maxRuns); prints how much time that saved
+#compared with running every cell maxRuns times
+def collectRunsAdaptive(targetRelativeError=0.05, minRuns=5, maxRuns=50, algorithmTable=None, inputTable=None, sizeList=None):
+    algorithmTable = algorithms if algorithmTable is None else algorithmTable
+    inputTable = inputTypes if inputTable is None else inputTable
+    sizeList = sizes if sizeList is None else sizeList
+    overallTime = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+    overallSpace = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+    results = BenchmarkResults(bootstrapRounds=500)  # a coarser bootstrap is plenty for a stopping rule
+    cellCost = defaultdict(float)  # wall-clock seconds spent measuring each cell
+    active = {(algoName, inputName, size) for algoName in algorithmTable for inputName in inputTable for size in sizeList}
+
+    startTime = time.perf_counter()
+    for run in range(maxRuns):
+        if not active:
+            break
+        for size in sizeList:
+            for inputName, generator in inputTable.items():
+                arr = generator(size)
+                smallKeyRange = isSmallKeyRange(arr)
+                for algoName, (algoFunc, inPlace) in algorithmTable.items():
+                    key = (algoName, inputName, size)
+                    if key not in active:
+                        continue
+                    if algoName in integerKeySorts and not smallKeyRange:
+                        active.discard(key)
+                        continue
+                    cellStart = time.perf_counter()
+                    elapsed, peak = timeSortingAlgorithm(algoFunc, arr, inPlace)
+                    cellCost[key] += time.perf_counter() - cellStart
+                    overallTime[algoName][inputName][size].append(elapsed)
+                    overallSpace[algoName][inputName][size].append(peak)
+                    results.add(algoName, inputName, size, [elapsed])
+                    if run + 1 >= minRuns and results.isConverged(key, targetRelativeError):
+                        active.discard(key)
+    totalTime = time.perf_counter() - startTime
+
+    print(f"\nAdaptive Scheduling (target relative error {targetRelativeError:.0%}, {minRuns}-{maxRuns} runs per cell):")
+    fixedEstimate = 0.0
+    for key, cost in sorted(cellCost.items()):
+        runsUsed = len(overallTime[key[0]][key[1]][key[2]])
+        fixedEstimate += cost / runsUsed * maxRuns
+        print(f"  {key[0]} / {key[1]} / {key[2]}: {runsUsed} runs")
+    print(f"Measured in {totalTime:.2f}s; a fixed {maxRuns}-run loop would take about {fixedEstimate:.2f}s "
+          f"(saved {fixedEstimate - totalTime:.2f}s, {1 - totalTime / fixedEstimate:.0%})")
+    return overallTime, overallSpace
+
+# — Auto-Selecting Sort
+calibrationPath = "sort_calibration.json"
+#Used until a calibration file exists: hybridSort is never far from the best on any input type
+defaultCalibration = {"sizes": [100], "rankings": {inputName: {"100": ["Hybrid Sort"]} for inputName in inputTypes}}
+loadedCalibration = None
+
+#Builds a calibration table from harness timings: for each input type and size, algorithms ordered fastest first by median
+def buildCalibration(timeData):
+    results = BenchmarkResults(timeData)
+    rankings = defaultdict(dict)
+    for algoName, inputName, size in results.samples:
+        if str(size) not in rankings[inputName]:
+            keys = sorted(results.cells(inputName, size), key=results.median)
+            rankings[inputName][str(size)] = [key[0] for key in keys]
+    return {"sizes": sorted({size for _, _, size in results.samples}), "rankings": dict(rankings)}
+
+def saveCalibration(calibration, path=calibrationPath):
+    with open(path, "w") as calibrationFile:
+        json.dump(calibration, calibrationFile, indent=2)
+
+def loadCalibration(path=calibrationPath):
+    with open(path) as calibrationFile:
+        return json.load(calibrationFile)
+
+#Input profile by run count: one O(n) pass counts the descents between neighbours, so arr is Sorted only when it is
+#one non-descending run and Reversed only when every neighbour descends (a sample could miss a single stray item)
+def classifyInput(arr):
+    n = len(arr)
+    descents = sum(b < a for a, b in zip(arr, islice(arr, 1, None)))
+    if descents == 0:
+        return "Sorted"
+    if descents == n - 1:
+        return "Reversed"
+    return "Random"
+
+quadraticSorts = {"Bubble Sort"}  # only dispatched to for short lists or verified sorted input, where they finish in O(n)
+
+#Sorts arr in place with whichever algorithm the calibration table says is fastest for inputs like it
+#(same order class, nearest calibrated size on a log scale); integer-key sorts are skipped when the key range
+#is too wide. Returns the name of the algorithm used
+def autoSort(arr, calibration=None):
+    global loadedCalibration
+    if calibration is None:
+        if loadedCalibration is None:
+            loadedCalibration = loadCalibration() if os.path.exists(calibrationPath) else defaultCalibration
+        calibration = loadedCalibration
+    inputClass = classifyInput(arr)
+    nearestSize = min(calibration["sizes"], key=lambda size: abs(math.log(size) - math.log(max(len(arr), 1))))
+    ranking = calibration["rankings"].get(inputClass, {}).get(str(nearestSize), [])
+    for algoName in ranking + ["Hybrid Sort"]:
+        if algoName not in algorithms or (algoName in integerKeySorts and not isSmallKeyRange(arr)):
+            continue
+        if algoName in quadraticSorts and inputClass != "Sorted" and len(arr) > insertionThreshold:
+            continue
+        algorithms[algoName][0](arr)
+        return algoName
+
+# — External Merge Sort
+#Records are signed 64-bit integers stored back to back in native byte order (array("q").tofile format)
+recordSize = 8
+#Bytes per item while a chunk is sorted: a list slot (8), a 64-bit Python int (up to 36), and hybridSort's merge buffer
+#plus the slice it copies into it (8 each). Sized for the worst case so tracemalloc peaks stay under the budget
+bytesPerSortedItem = 64
+maxMergeFanIn = 64  # runs merged at once; more runs than this take extra merge passes
+mergeRunOverhead = 2048  # bytes of per-run bookkeeping during a merge, measured with tracemalloc
+spillBufferItems = 2**12  # records converted to an array at a time when writing a list out
+
+#Writes values through a small array buffer, so spilling a sorted list never copies all of it at once
+def writeIntegerFile(path, values):
+    values = iter(values)
+    with open(path, "wb") as outputFile:
+        while True:
+            block = array("q", islice(values, spillBufferItems))
+            if not block:
+                return
+            block.tofile(outputFile)
+
+#Reads up to maxItems records from an open file straight into a new array (no intermediate bytes object)
+def readIntegerArray(inputFile, maxItems):
+    chunk = array("q", [0]) * maxItems
+    bytesRead = 0
+    with memoryview(chunk).cast("B") as view:
+        while bytesRead < len(view):  # an unbuffered file may return fewer bytes than asked for
+            count = inputFile.readinto(view[bytesRead:])
+            if not count:
+                break
+            bytesRead += count
+    del chunk[bytesRead // recordSize:]
+    return chunk
+
+#Streams the records of a file as arrays of up to chunkItems records. The file is unbuffered, since the merge keeps one
+#open per run and their 8 KB read buffers would add up past the memory budget
+def readIntegerChunks(path, chunkItems):
+    with open(path, "rb", buffering=0) as inputFile:
+        while True:
+            chunk = readIntegerArray(inputFile, chunkItems)
+            if not chunk:
+                return
+            yield chunk
+
+#Yields every record of a sorted run file, reading bufferItems at a time (or straight from an mmap)
+def iterRun(path, bufferItems, useMmap=False):
+    if useMmap:
+        with open(path, "rb", buffering=0) as runFile:
+            if os.path.getsize(path) == 0:
+                return
+            with mmap.mmap(runFile.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                records = memoryview(mapped).cast("q")
+                try:
+                    yield from records
+                finally:
+                    records.release()  # mmap can't close while a view of it is alive
+    else:
+        for chunk in readIntegerChunks(path, bufferItems):
+            yield from chunk
+
+#Records per merge buffer. The budget covers a read buffer per run, the output buffer plus its growth slack, the one extra
+#read buffer alive while a run swaps to its next block, and mergeRunOverhead bytes of file, generator and heap state per run
+def mergeBufferItems(memoryBudget, numRuns):
+    return max(1, (memoryBudget - numRuns * mergeRunOverhead) // recordSize // (numRuns + 3))
+
+#k-way merges sorted run files into outputPath with heapq.merge, writing through a buffer of bufferItems records
+def mergeRunFiles(runPaths, outputPath, bufferItems, useMmap=False):
+    with open(outputPath, "wb") as outputFile:
+        outputBuffer = array("q")
+        for value in heapq.merge(*(iterRun(path, bufferItems, useMmap) for path in runPaths)):
+            outputBuffer.append(value)
+            if len(outputBuffer) >= bufferItems:
+                outputBuffer.tofile(outputFile)
+                outputBuffer = array("q")
+        outputBuffer.tofile(outputFile)
+
+#Sorts a file of integer records that may not fit in memory: sorts memoryBudget-sized chunks with sortFunc, spills each
+#as a sorted run to a temp file, then k-way merges the runs (in several passes if there are more than maxMergeFanIn).
+#Returns throughput metrics
+def externalSort(inputPath, outputPath, memoryBudget=64 * 2**20, sortFunc=hybridSort, useMmap=False, tempDir=None):
+    startTime = time.perf_counter()
+    chunkItems = max(1, (memoryBudget - spillBufferItems * recordSize) // bytesPerSortedItem)  # leave room to spill
+    totalRecords = 0
+    mergePasses = 0
+    with tempfile.TemporaryDirectory(dir=tempDir) as workDir:
+        runPaths = []
+        with open(inputPath, "rb") as inputFile:
+            while True:
+                chunk = readIntegerArray(inputFile, chunkItems)
+                if not chunk:
+                    break
+                # only one copy of the chunk is alive at a time: the array goes before the sort, the list before the next read
+                values = chunk.tolist()
+                del chunk
+                sortFunc(values)
+                runPath = os.path.join(workDir, f"run{len(runPaths)}.bin")
+                writeIntegerFile(runPath, values)
+                runPaths.append(runPath)
+                totalRecords += len(values)
+                del values
+        sortTime = time.perf_counter() - startTime
+        initialRuns = len(runPaths)
+
+        while len(runPaths) > maxMergeFanIn:
+            mergePasses += 1
+            mergedPaths = []
+            for i in range(0, len(runPaths), maxMergeFanIn):
+                group = runPaths[i:i + maxMergeFanIn]
+                mergedPath = os.path.join(workDir, f"pass{mergePasses}_{len(mergedPaths)}.bin")
+                mergeRunFiles(group, mergedPath, mergeBufferItems(memoryBudget, len(group)), useMmap)
+                for path in group:
+                    os.remove(path)
+                mergedPaths.append(mergedPath)
+            runPaths = mergedPaths
+        mergePasses += 1
+        mergeRunFiles(runPaths, outputPath, mergeBufferItems(memoryBudget, len(runPaths)), useMmap)
+
+    totalTime = time.perf_counter() - startTime
+    megabytes = totalRecords * recordSize / 2**20
+    return {
+        "records": totalRecords, "runs": initialRuns, "mergePasses": mergePasses,
+        "sortSeconds": sortTime, "mergeSeconds": totalTime - sortTime, "totalSeconds": totalTime,
+        "mbPerSecond": megabytes / totalTime if totalTime > 0 else float("inf")
+    }
+
+#Sorts a generated file of random patient IDs under a small memory budget, checks the output and prints the metrics
+def benchmarkExternalSort(numRecords=2000000, memoryBudget=16 * 2**20, useMmap=False):
+    with tempfile.TemporaryDirectory() as workDir:
+        inputPath = os.path.join(workDir, "unsorted.bin")
+        outputPath = os.path.join(workDir, "sorted.bin")
+        writeIntegerFile(inputPath, (random.randint(1, 10**9) for _ in range(numRecords)))
+        metrics = externalSort(inputPath, outputPath, memoryBudget, useMmap=useMmap)
+        previous = None
+        for chunk in readIntegerChunks(outputPath, 2**16):
+            assert previous is None or previous <= chunk[0]
+            assert all(chunk[i] <= chunk[i + 1] for i in range(len(chunk) - 1))
+            previous = chunk[-1]
+    print(f"\nExternal sort of {metrics['records']} records ({metrics['records'] * recordSize / 2**20:.1f} MB) "
+          f"with a {memoryBudget / 2**20:.0f} MB budget:")
+    print(f"  {metrics['runs']} sorted runs in {metrics['sortSeconds']:.2f}s, "
+          f"{metrics['mergePasses']} merge pass(es) in {metrics['mergeSeconds']:.2f}s")
+    print(f"  Throughput: {metrics['mbPerSecond']:.2f} MB/s")
+    return metrics
+
 # — Main Execution Block
 if __name__ == "__main__":
-    print("After 50 runs, these are the results: (this may take a moment, please be patient...)\n")
-    timeData, spaceData = collectRunsWithSpace()
+    if "--external" in sys.argv:  # out-of-core sort of a generated file, then exit
+        benchmarkExternalSort()
+        sys.exit()
+    if "--speedup" in sys.argv:  # parallel merge sort scaling, then exit
+        reportParallelSpeedup()
+        sys.exit()
+    if "--numpy" in sys.argv:  # NumPy backend: large arrays, vectorized sorts only
+        print(f"Running the NumPy backend on sizes {numpySizes} (3 runs each)...\n")
+        timeData, spaceData = collectRunsWithSpace(3, numpyAlgorithms, numpyInputTypes, numpySizes)
+    elif "--adaptive" in sys.argv:  # stop each cell once its estimate converges
+        print("Running each cell until its estimate converges (up to 50 runs)...\n")
+        timeData, spaceData = collectRunsAdaptive()
+    elif "--cached" in sys.argv:  # reuse stored samples, only measuring new or changed algorithms
+        print(f"Loading 50 runs from {resultStorePath} (measuring anything missing)...\n")
+        timeData, spaceData = collectRunsCached()
+    elif "--parallel" in sys.argv:  # same 50 runs, spread across every core
+        print(f"After 50 runs on {os.cpu_count()} cores, these are the results:\n")
+        timeData, spaceData = collectRunsParallel()
+    else:
+        print("After 50 runs, these are the results: (this may take a moment, please be patient...)\n")
+        timeData, spaceData = collectRunsWithSpace()
     analyzeComplexityTrends(timeData, spaceData)
-    rankAlgorithmsByTime(timeData)
\ No newline at end of file
+    rankAlgorithmsByTime(timeData)
+    rankAlgorithmsWithConfidence(timeData)
+    if "--overhead" in sys.argv:
+        reportMeasurementOverhead()
+    if "--calibrate" in sys.argv:  # save the fastest-algorithm table for autoSort
+        saveCalibration(buildCalibration(timeData))
+        print(f"\nSaved autoSort calibration to {calibrationPath}")
+    if "--scaling" in sys.argv:
+        for inputName in inputTypes:
+            analyzeComplexityScaling(inputName)
\ No newline at end of file